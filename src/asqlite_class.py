@@ -1,15 +1,18 @@
 import aiosqlite
+import asyncio
+import json
 import logging
-from typing import Tuple
-
-from src.database_schemas import (
-    users_schema, 
-    ingredients_schema, 
-    inventory_schema, 
-    conversions_schema, 
-    recipes_schema, 
-    recipe_ingredients_schema
-)
+import os
+import sqlite3
+from itertools import combinations
+from pathlib import Path
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import date
+from typing import Any, AsyncIterator, Literal, Sequence, Tuple
+
+from src.database_schemas import schema_ddl
 from src.data_models import (
     IngredientInsertion,
     InventoryInsertion,
@@ -27,10 +30,349 @@ from src.error_models import (
 
 logger = logging.getLogger('uvicorn.error')
 
+# Bind `expiration_date` values as ISO-8601 TEXT explicitly. sqlite3's built-in date adapter is deprecated
+# since Python 3.12. Reads stay TEXT: Pydantic parses them into `date` when the response models are built.
+sqlite3.register_adapter(date, date.isoformat)
+
+# Connection tuning applied once per connection: WAL lets readers run alongside the writer,
+# synchronous=NORMAL drops the per-commit fsync, and the page cache / mmap keep hot pages in memory.
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA foreign_keys = ON;
+"""
+
+# Read connections live for the whole process, so each one gets a larger mmap window (1 GiB) and
+# a 32 MiB page cache. Memory adds up per process as READ_POOL_SIZE readers (up to 4) x cache_size,
+# i.e. up to 128 MiB of page cache per uvicorn worker, on top of the writer's 64 MiB. The mmap window
+# is address space backed by the OS page cache, which is shared by every connection and worker,
+# and pages read through it do not go into the per-connection cache.
+READ_CONNECTION_PRAGMAS = CONNECTION_PRAGMAS + """
+    PRAGMA cache_size = -32768;
+    PRAGMA mmap_size = 1073741824;
+"""
+
+# Reads the hot B-trees once so the first requests don't pay for cold reads. count(*) alone only
+# walks the smallest index of a table, so the warm-up names each structure the lookups use:
+# the ingredients table and its UNIQUE(name) index, and the inventory table, its UNIQUE(user_id,
+# ingredient_id) index and the ix_inventory_cover covering index.
+_SQL_WARM_UP = """
+    SELECT count(*) FROM ingredients INDEXED BY sqlite_autoindex_ingredients_1;
+    SELECT sum(length(unit_type)) FROM ingredients NOT INDEXED;
+    SELECT count(*) FROM inventory INDEXED BY sqlite_autoindex_inventory_1;
+    SELECT sum(quantity) FROM inventory INDEXED BY ix_inventory_cover;
+    SELECT sum(length(updated_at)) FROM inventory NOT INDEXED;
+"""
+
+# Set LOG_QUERY_PLANS=1 to log the EXPLAIN QUERY PLAN of the hot lookups at connect, for checking index usage.
+# An env flag rather than the DEBUG level, because main.py pins the shared `uvicorn.error` logger to INFO.
+LOG_QUERY_PLANS = os.getenv("LOG_QUERY_PLANS") == "1"
+
+# Size of sqlite3's per-connection prepared statement cache (the default is 100).
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds a connection waits on a locked database before raising "database is locked".
+BUSY_TIMEOUT_SECONDS = 5.0
+
+# Number of read-only connections kept open next to the single writer connection.
+# Under WAL each reader runs on its own aiosqlite thread without blocking the writer.
+READ_POOL_SIZE = min(os.cpu_count() or 1, 4)
+
+# Maximum number of entries kept in each in-process ingredient metadata cache.
+UNIT_CACHE_SIZE = 4096
+
+# Rows fetched per round trip when streaming large result sets
+FETCH_CHUNK_SIZE = 1000
+
+# Seconds a read waits for a free pooled connection before giving up with TimeoutError,
+# so a saturated pool fails requests instead of queueing them forever.
+READ_ACQUIRE_TIMEOUT_SECONDS = 10.0
+
+# Seconds between background `PRAGMA wal_checkpoint(TRUNCATE)` runs, which fold the WAL back into
+# the database file and truncate it so it does not keep growing under steady writes.
+WAL_CHECKPOINT_INTERVAL_SECONDS = 60
+
+# Hot read queries are kept as module-level constants so every call passes the same SQL text
+# and hits sqlite3's prepared statement cache instead of re-parsing and re-planning the query.
+# The name is resolved to an id by a scalar subquery (one seek on the UNIQUE name index), so the outer
+# query is the same single (user_id, ingredient_id) probe as the by-id lookup.
+# The planner prefers the UNIQUE(user_id, ingredient_id) index for a full-key equality, which then needs
+# a second seek into the table for the other columns. Inventory reads therefore name ix_inventory_cover
+# with INDEXED BY, which answers them from the index alone.
+_SQL_QUANTITY_BY_NAME = """
+    SELECT quantity
+    FROM inventory INDEXED BY ix_inventory_cover
+    WHERE user_id = ? AND ingredient_id = (SELECT id FROM ingredients WHERE name = ?)
+    LIMIT 1
+"""
+
+_SQL_QUANTITY_BY_ID = """
+    SELECT quantity
+    FROM inventory INDEXED BY ix_inventory_cover
+    WHERE user_id = ? AND ingredient_id = ?
+    LIMIT 1
+"""
+
+_SQL_UNIT_BY_NAME = """
+    SELECT unit_type
+    FROM ingredients
+    WHERE name = ?
+    LIMIT 1
+"""
+
+_SQL_UNIT_BY_ID = """
+    SELECT unit_type
+    FROM ingredients
+    WHERE id = ?
+    LIMIT 1
+"""
+
+# The `_SQL_INFO_*` queries select columns named exactly like the Ingredient fields,
+# so rows (sqlite3.Row) convert straight into keyword arguments.
+_SQL_INFO_BY_NAME = """
+    SELECT t1.name, t1.category, t1.unit_type, t2.quantity, t2.minimum_threshold, t2.expiration_date
+    FROM ingredients t1
+    INNER JOIN inventory t2 INDEXED BY ix_inventory_cover
+    ON t1.id = t2.ingredient_id
+    WHERE t1.name = ? AND t2.user_id = ?
+"""
+
+# Driven from inventory so the (user_id, ingredient_id) key is probed first
+_SQL_INFO_BY_ID = """
+    SELECT t1.name, t1.category, t1.unit_type, t2.quantity, t2.minimum_threshold, t2.expiration_date
+    FROM inventory t2 INDEXED BY ix_inventory_cover
+    INNER JOIN ingredients t1
+    ON t1.id = t2.ingredient_id
+    WHERE t2.ingredient_id = ? AND t2.user_id = ?
+"""
+
+# The bulk lookups bind their keys as one JSON array and expand it with json_each, so a single
+# prepared statement serves any number of keys without hitting the bound parameter limit.
+# The name-keyed joins start from the array (CROSS JOIN pins the order) so each name is an index
+# probe, rather than a scan of the user's whole inventory. ?1 is the user id, ?2 the JSON array.
+_SQL_INFO_BULK_BY_NAMES = """
+    SELECT t1.name, t1.category, t1.unit_type, t2.quantity, t2.minimum_threshold, t2.expiration_date
+    FROM json_each(?2) keys
+    CROSS JOIN ingredients t1 ON t1.name = keys.value
+    INNER JOIN inventory t2 INDEXED BY ix_inventory_cover ON t1.id = t2.ingredient_id
+    WHERE t2.user_id = ?1
+"""
+
+_SQL_QUANTITIES_BY_IDS = """
+    SELECT ingredient_id, quantity
+    FROM inventory INDEXED BY ix_inventory_cover
+    WHERE user_id = ? AND ingredient_id IN (SELECT value FROM json_each(?))
+"""
+
+_SQL_QUANTITIES_BY_NAMES = """
+    SELECT t2.name, t1.quantity
+    FROM json_each(?2) keys
+    CROSS JOIN ingredients t2 ON t2.name = keys.value
+    INNER JOIN inventory t1 INDEXED BY ix_inventory_cover ON t1.ingredient_id = t2.id
+    WHERE t1.user_id = ?1
+"""
+
+_SQL_UPSERT_INVENTORY = """
+    INSERT INTO inventory (user_id, ingredient_id, quantity, minimum_threshold, expiration_date)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, ingredient_id) DO UPDATE SET
+        quantity = excluded.quantity,
+        minimum_threshold = excluded.minimum_threshold,
+        expiration_date = excluded.expiration_date,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Inventory columns that callers may read or update by name. Column names in dynamic SQL only
+# ever come from this fixed set, never from the caller, so nothing untrusted is interpolated.
+INVENTORY_FIELDS = ("quantity", "minimum_threshold", "expiration_date")
+
+# One projected query per readable inventory column.
+_SQL_INVENTORY_FIELD = {
+    field: f"SELECT {field} FROM inventory WHERE user_id = ? AND ingredient_id = ? LIMIT 1"
+    for field in INVENTORY_FIELDS
+}
+
+# Returned by the inventory INSERT and UPDATEs so the response is built without a follow-up SELECT.
+# Columns are aliased to the IngredientFullResponse field names so the row validates straight into the model.
+_SQL_RETURNING_FULL_RESPONSE = """
+    RETURNING id AS inventory_id, user_id, ingredient_id, quantity, minimum_threshold, expiration_date, created_at, updated_at,
+        (SELECT name FROM ingredients WHERE ingredients.id = inventory.ingredient_id) AS name,
+        (SELECT category FROM ingredients WHERE ingredients.id = inventory.ingredient_id) AS category,
+        (SELECT unit_type FROM ingredients WHERE ingredients.id = inventory.ingredient_id) AS unit_type
+"""
+
+
+def _inventory_update_sql(fields: tuple[str, ...], where: str) -> str:
+    """Build the UPDATE ... RETURNING statement that sets `fields` (and `updated_at`) on the rows matching `where`."""
+    set_clause = ", ".join([f"{field} = ?" for field in fields] + ["updated_at = CURRENT_TIMESTAMP"])
+    return f"UPDATE inventory SET {set_clause} WHERE {where} {_SQL_RETURNING_FULL_RESPONSE}"
+
+
+# Every UPDATE an inventory update can need, one per non-empty subset of INVENTORY_FIELDS (in field order).
+# Built once at import, so an update only picks a string and the statement cache sees the same 7 texts.
+_UPDATE_FIELD_SETS = [fields for n in range(1, len(INVENTORY_FIELDS) + 1) for fields in combinations(INVENTORY_FIELDS, n)]
+_SQL_UPDATE_INVENTORY_BY_ID = {
+    fields: _inventory_update_sql(fields, "user_id = ? AND ingredient_id = ?")
+    for fields in _UPDATE_FIELD_SETS
+}
+_SQL_UPDATE_INVENTORY_BY_NAME = {
+    fields: _inventory_update_sql(fields, "user_id = ? AND ingredient_id = (SELECT id FROM ingredients WHERE name = ?)")
+    for fields in _UPDATE_FIELD_SETS
+}
+
+_SQL_INGREDIENT_UNITS = """
+    SELECT id, name, unit_type
+    FROM ingredients
+    LIMIT ?
+"""
+
+_SQL_INSERT_TEST_USER = """
+    INSERT OR IGNORE INTO users (email, hashed_pw) 
+    VALUES (?, 'dummy_hash_for_testing')
+"""
+
+_SQL_USER_ID_BY_EMAIL = "SELECT id FROM users WHERE email = ?"
+
+_SQL_INGREDIENT_ID_BY_NAME = """
+    SELECT id
+    FROM ingredients
+    WHERE name = ?
+"""
+
+_SQL_INGREDIENT_IDS_BY_NAMES = """
+    SELECT id, name
+    FROM ingredients
+    WHERE name IN (SELECT value FROM json_each(?))
+"""
+
+_SQL_EXISTS_IN_INVENTORY_BY_NAME = """
+    SELECT 1
+    FROM inventory
+    WHERE user_id = ? AND ingredient_id = (SELECT id FROM ingredients WHERE name = ?)
+    LIMIT 1
+"""
+
+_SQL_EXISTS_IN_INVENTORY_BY_ID = """
+    SELECT 1
+    FROM inventory
+    WHERE user_id = ? AND ingredient_id = ?
+    LIMIT 1
+"""
+
+_SQL_EXISTS_IN_INGREDIENTS_BY_NAME = """
+    SELECT 1
+    FROM ingredients
+    WHERE name = ?
+    LIMIT 1
+"""
+
+_SQL_EXISTS_IN_INGREDIENTS_BY_ID = """
+    SELECT 1
+    FROM ingredients
+    WHERE id = ?
+    LIMIT 1
+"""
+
+_SQL_INSERT_INGREDIENT = """
+    INSERT INTO ingredients (name, category, unit_type)
+    VALUES (?, ?, ?)
+    ON CONFLICT(name) DO NOTHING
+    RETURNING id
+"""
+
+_SQL_INSERT_INVENTORY = f"""
+    INSERT INTO inventory (user_id, ingredient_id, quantity, minimum_threshold, expiration_date)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, ingredient_id) DO NOTHING
+    {_SQL_RETURNING_FULL_RESPONSE}
+"""
+
+# Bulk variants for executemany. Existing rows are skipped rather than raising, and without
+# RETURNING the statement is prepared once for the whole batch.
+_SQL_INSERT_INGREDIENTS_BULK = """
+    INSERT INTO ingredients (name, category, unit_type)
+    VALUES (?, ?, ?)
+    ON CONFLICT(name) DO NOTHING
+"""
+
+_SQL_INSERT_INVENTORY_BULK = """
+    INSERT INTO inventory (user_id, ingredient_id, quantity, minimum_threshold, expiration_date)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, ingredient_id) DO NOTHING
+"""
+
+_SQL_DELETE_INVENTORY_BY_ID = """
+    DELETE FROM inventory 
+    WHERE ingredient_id = ? AND user_id = ?
+"""
+
+_SQL_DELETE_INVENTORY_BY_NAME = """
+    DELETE FROM inventory 
+    WHERE user_id = ? AND ingredient_id = (
+        SELECT id FROM ingredients WHERE name = ?
+    )
+"""
+
+# One page of the user's inventory, keyed on ingredient_id (unique per user) so the next page starts with
+# a seek on the (user_id, ingredient_id) index instead of skipping an OFFSET. ?1 user id, ?2 last
+# ingredient_id seen (0 for the first page), ?3 page size.
+# Not in _SQL_POOL_READS: LIMIT rejects the NULL bind of the prewarm, and one prepare per streamed listing is negligible.
+# Columns are aliased to the IngredientFullResponse field names so rows validate straight into the model.
+_SQL_INVENTORY_PAGE = """
+    SELECT t1.id AS ingredient_id, t1.name, t1.category, t1.unit_type, t2.id AS inventory_id, t2.user_id,
+        t2.quantity, t2.minimum_threshold, t2.expiration_date, t2.created_at, t2.updated_at
+    FROM inventory t2
+    INNER JOIN ingredients t1
+    ON t1.id = t2.ingredient_id
+    WHERE t2.user_id = ?1 AND t2.ingredient_id > ?2
+    ORDER BY t2.ingredient_id
+    LIMIT ?3
+"""
+
+# Every read the pool serves. Each reader runs them once at startup (with NULL parameters, so nothing
+# matches) to compile them into its statement cache before the first request arrives.
+_SQL_POOL_READS = [
+    _SQL_QUANTITY_BY_NAME,
+    _SQL_QUANTITY_BY_ID,
+    _SQL_UNIT_BY_NAME,
+    _SQL_UNIT_BY_ID,
+    _SQL_INFO_BY_NAME,
+    _SQL_INFO_BY_ID,
+    _SQL_INFO_BULK_BY_NAMES,
+    _SQL_QUANTITIES_BY_IDS,
+    _SQL_QUANTITIES_BY_NAMES,
+    *_SQL_INVENTORY_FIELD.values(),
+    _SQL_INGREDIENT_ID_BY_NAME,
+    _SQL_INGREDIENT_IDS_BY_NAMES,
+    _SQL_EXISTS_IN_INVENTORY_BY_NAME,
+    _SQL_EXISTS_IN_INVENTORY_BY_ID,
+    _SQL_EXISTS_IN_INGREDIENTS_BY_NAME,
+    _SQL_EXISTS_IN_INGREDIENTS_BY_ID,
+]
+
+
 class SqliteManager:
     def __init__(self, db_name: str) -> None:
         self.db_name = db_name
-        self.conn = None
+        self.conn = None # Writer connection
+        # Every connection to ":memory:" (or "") opens its own private database, so in-memory
+        # databases have no read pool and serve reads from the writer connection.
+        self._in_memory = db_name in (":memory:", "")
+        self._read_pool: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        # LRU caches of ingredient -> unit_type. unit_type is effectively immutable once an ingredient exists.
+        self._unit_by_name: OrderedDict[str, str] = OrderedDict()
+        self._unit_by_id: OrderedDict[int, str] = OrderedDict()
+        # LRU cache of ingredient name -> id. Ingredient ids never change once assigned.
+        self._id_by_name: OrderedDict[str, int] = OrderedDict()
+        # Serializes writes on the writer connection; the context var marks the task that holds it
+        self._write_lock = asyncio.Lock()
+        self._in_transaction: ContextVar[bool] = ContextVar(f"in_transaction_{id(self)}", default=False)
+        # (cache, key) pairs added to the metadata caches while a transaction is open, dropped again on rollback
+        self._transaction_cache_keys: list[tuple[OrderedDict, Any]] | None = None
     
     async def connect(self) -> None:
         """
@@ -39,46 +381,228 @@ class SqliteManager:
         """
         # Connect to the database
         try:
-            self.conn = await aiosqlite.connect(self.db_name)
-
-            await self.conn.execute("PRAGMA foreign_keys = ON;") # Enforce foreign key constraints
+            self.conn = await self._open_connection()
 
-            self.cur = await self.conn.cursor()
+            # SQLite silently keeps the old journal mode when WAL is unavailable (e.g. ":memory:" or some network
+            # filesystems). Readers then block the writer, so make that visible.
+            (journal_mode,), = await self.conn.execute_fetchall("PRAGMA journal_mode;")
+            if journal_mode.lower() != "wal":
+                logger.warning(f"SQLite is using journal_mode={journal_mode} instead of WAL for {self.db_name}.")
 
-            # Initialize the users table
-            await self.cur.execute(users_schema)
-            
-            # Initialize the ingredients table
-            await self.cur.execute(ingredients_schema)
+            # Initialize the users, ingredients, inventory, conversions, recipes and recipe_ingredients tables.
+            # executescript commits any open transaction first, so the BEGIN/COMMIT lives inside the script
+            # to create every table under a single fsync.
+            await self.conn.executescript(f"BEGIN;\n{schema_ddl}\nCOMMIT;")
 
-            # Initialize the inventory table
-            await self.cur.execute(inventory_schema)
+            # Gather sqlite_stat1 statistics so the planner picks the right index on skewed data
+            await self.conn.execute("ANALYZE;")
+            await self.conn.commit()
 
-            # Initialize conversions table
-            await self.cur.execute(conversions_schema)
+            logger.info("Set up the tables.")
 
-            # Initialize recipes schema
-            await self.cur.execute(recipes_schema)
+            # Open the read connections once the tables exist
+            for _ in range(0 if self._in_memory else READ_POOL_SIZE):
+                read_conn = await self._open_connection(READ_CONNECTION_PRAGMAS, read_only=True)
+                # Pooled before warming up, so a failed warm-up still closes it
+                self._read_pool.put_nowait(read_conn)
+                await read_conn.executescript(_SQL_WARM_UP)
+                for query in _SQL_POOL_READS:
+                    await read_conn.execute_fetchall(query, (None,) * query.count("?"))
+            logger.info(f"Opened and warmed up {self._read_pool.qsize()} read connections.")
 
-            # Initialize recipe_ingredients schema
-            await self.cur.execute(recipe_ingredients_schema)
+            # Preload the measurement unit caches so unit lookups skip SQLite from the first request
+            await self.refresh_metadata()
 
-            logger.info("Set up the tables.")
+            if LOG_QUERY_PLANS:
+                await self._log_query_plans()
 
         except aiosqlite.Error as e1:
             logger.error(f"SQLite error when connnecting to {self.db_name} with error: {e1}")
+            # Close what was opened, otherwise the connection threads keep the process from exiting
+            await self._close_connections()
             raise
         except Exception as e2:
             logger.error(f"Error when connecting to {self.db_name} with error: {e2}")
+            await self._close_connections()
             raise
 
+    async def _open_connection(self, pragmas: str = CONNECTION_PRAGMAS, read_only: bool = False) -> aiosqlite.Connection:
+        """
+        Open a connection to self.db_name with the statement cache sized and the connection PRAGMAs applied.
+
+        Args:
+            pragmas (str) - The PRAGMA script to run on the new connection.
+            read_only (bool) - Open the database with `mode=ro`, so any write on the connection fails.
+        Returns:
+            Connection of type "aiosqlite.Connection".
+        """
+        if read_only:
+            database, uri = f"{Path(self.db_name).resolve().as_uri()}?mode=ro", True
+        else:
+            database, uri = self.db_name, False
+        conn = await aiosqlite.connect(database, uri=uri, timeout=BUSY_TIMEOUT_SECONDS, cached_statements=STATEMENT_CACHE_SIZE)
+        # Rows still index and unpack like tuples, but can also be converted with dict(row)
+        conn.row_factory = sqlite3.Row
+
+        # Apply the connection PRAGMAs (WAL, cache sizing, foreign key constraints) in one round-trip
+        await conn.executescript(pragmas)
+        await conn.commit()
+        return conn
+
+    @asynccontextmanager
+    async def acquire_read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a connection from the read pool, waiting up to READ_ACQUIRE_TIMEOUT_SECONDS if all of them are in use.
+        Only use the connection for SELECT statements; all writes go through self.conn.
+
+        Args:
+            None.
+        Returns:
+            Connection of type "aiosqlite.Connection", returned to the pool on exit.
+            The writer connection for in-memory databases, which have no read pool.
+        """
+        if self._in_memory:
+            yield self.conn
+            return
+
+        try:
+            conn = await asyncio.wait_for(self._read_pool.get(), READ_ACQUIRE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            raise TimeoutError(f"No read connection became free within {READ_ACQUIRE_TIMEOUT_SECONDS} seconds.") from None
+        try:
+            yield conn
+        finally:
+            self._read_pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Run several writes on the writer connection as one transaction, paying for a single commit.
+        Commits when the block exits normally and rolls back if it, or the commit, raises.
+
+        Every write method runs inside this, so wrapping several of them in an outer
+        `transaction()` (e.g. from an endpoint) makes them commit once, together.
+        Nested blocks join the outer transaction. Other tasks wait for the write lock
+        instead of interleaving their statements into the open transaction.
+
+        Args:
+            None.
+        Returns:
+            Connection of type "aiosqlite.Connection" (the writer) to execute the writes on.
+        """
+        if self._in_transaction.get():
+            yield self.conn
+            return
+
+        async with self._write_lock:
+            token = self._in_transaction.set(True)
+            self._transaction_cache_keys = []
+            try:
+                await self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield self.conn
+                    # Inside the try so a failed COMMIT (e.g. SQLITE_BUSY, disk I/O) is rolled back too,
+                    # instead of leaving the writer stuck in the open transaction
+                    await self.conn.commit()
+                except BaseException:
+                    await self.conn.rollback()
+                    # Ingredient metadata is append-only, so only entries cached during this transaction can be stale
+                    for cache, key in self._transaction_cache_keys:
+                        cache.pop(key, None)
+                    raise
+            finally:
+                self._transaction_cache_keys = None
+                self._in_transaction.reset(token)
+
+    def _cache_put(self, cache: OrderedDict, key, value) -> None:
+        """
+        Insert key into one of the metadata LRU caches, evicting the least recently used entry when full.
+        While a transaction is open the key is recorded, so a rollback can drop it again.
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > UNIT_CACHE_SIZE:
+            cache.popitem(last=False)
+        if self._transaction_cache_keys is not None:
+            self._transaction_cache_keys.append((cache, key))
+
+    async def _read_one(self, query: str, params: tuple) -> sqlite3.Row | None:
+        """
+        Run a read query on a pooled connection and return its first row.
+        Uses `execute_fetchall` so the execute and the fetch share one hop into the aiosqlite thread.
+
+        Args:
+            query (str) - The SELECT statement to run.
+            params (tuple) - The parameters bound to the query.
+        Returns:
+            sqlite3.Row | None - The first row, or None if nothing matched.
+        """
+        async with self.acquire_read() as conn:
+            rows = await conn.execute_fetchall(query, params)
+        return rows[0] if rows else None
+
+    async def _read_all(self, query: str, params: tuple) -> list[sqlite3.Row]:
+        """
+        Run a read query on a pooled connection and return all of its rows in one hop.
+
+        Args:
+            query (str) - The SELECT statement to run.
+            params (tuple) - The parameters bound to the query.
+        Returns:
+            list[sqlite3.Row] - The rows matched by the query.
+        """
+        async with self.acquire_read() as conn:
+            return list(await conn.execute_fetchall(query, params))
+
+    async def _log_query_plans(self) -> None:
+        """Log the EXPLAIN QUERY PLAN output of the hot lookups. Used for debugging index usage."""
+        for query_name, query in (
+            ("_SQL_QUANTITY_BY_NAME", _SQL_QUANTITY_BY_NAME),
+            ("_SQL_QUANTITY_BY_ID", _SQL_QUANTITY_BY_ID),
+            ("_SQL_INFO_BY_NAME", _SQL_INFO_BY_NAME),
+            ("_SQL_INFO_BY_ID", _SQL_INFO_BY_ID),
+        ):
+            async with self.conn.execute(f"EXPLAIN QUERY PLAN {query}", (None,) * query.count("?")) as cur:
+                plan = await cur.fetchall()
+            logger.info(f"Query plan for {query_name}: {[row[-1] for row in plan]}")
+
     async def close(self) -> None:
-        """Close the database connection"""
+        """Close the read connections and the writer connection"""
+        while not self._read_pool.empty():
+            read_conn = self._read_pool.get_nowait()
+            await read_conn.close()
         if self.conn:
+            # PRAGMA optimize lets SQLite analyze the tables the writer's queries used.
+            # It needs write access, so it cannot run on the read-only pool connections.
+            await self.conn.execute("PRAGMA optimize;")
+            await self.conn.commit()
             await self.conn.close()
             logger.info("Closed asqlite connection.")
-        
-    async def get_connection(self) -> aiosqlite.Connection:
+
+    async def _close_connections(self) -> None:
+        """Close whatever connections are open, without the PRAGMA optimize of close(). Used when connect() fails."""
+        while not self._read_pool.empty():
+            await self._read_pool.get_nowait().close()
+        if self.conn:
+            await self.conn.close()
+            self.conn = None
+
+    async def checkpoint(self) -> Tuple[int, int, int]:
+        """
+        Copy the WAL back into the database file and truncate it.
+        Holds the write lock so the checkpoint never runs inside another task's open transaction on the writer.
+        If a reader is still using the WAL, SQLite checkpoints what it can and reports busy.
+
+        Args:
+            None.
+        Returns:
+            Tuple[int, int, int] - (busy, WAL frames, frames checkpointed), as returned by the pragma.
+        """
+        async with self._write_lock:
+            rows = await self.conn.execute_fetchall("PRAGMA wal_checkpoint(TRUNCATE)")
+        return tuple(rows[0])
+
+    def get_connection(self) -> aiosqlite.Connection:
         """
         Get the connection to the sqlite database
 
@@ -93,17 +617,12 @@ class SqliteManager:
     
     async def create_test_user(self, email: str = "test@example.com") -> int:
         """Create a test user for development purposes. Not to be used in production."""
-        query = """
-            INSERT OR IGNORE INTO users (email, hashed_pw) 
-            VALUES (?, 'dummy_hash_for_testing')
-        """
-        await self.cur.execute(query, (email,))
-        await self.conn.commit()
-        
-        # Get the user ID
-        get_query = "SELECT id FROM users WHERE email = ?"
-        cursor = await self.cur.execute(get_query, (email,))
-        result = await cursor.fetchone()
+        async with self.transaction() as conn:
+            await conn.execute(_SQL_INSERT_TEST_USER, (email,))
+
+            # Get the user ID
+            async with conn.execute(_SQL_USER_ID_BY_EMAIL, (email,)) as cur:
+                result = await cur.fetchone()
         return result[0] if result else None    
     
     async def get_ingredient_quantity_by_name(self, ingredient_name: str, user_id: int) -> float:
@@ -118,15 +637,7 @@ class SqliteManager:
         Returns:
             float - The quantity of ingredient.
         """
-        query = """
-            SELECT t1.quantity 
-            FROM inventory t1
-            INNER JOIN ingredients t2
-            ON t1.ingredient_id = t2.id
-            WHERE t1.user_id = ? AND t2.name = ?
-        """
-        res = await self.cur.execute(query, (user_id, ingredient_name))
-        table: Tuple[float] = await res.fetchone()
+        table: Tuple[float] = await self._read_one(_SQL_QUANTITY_BY_NAME, (user_id, ingredient_name))
         return table[0] if table else 0.0
     
     async def get_ingredient_quantity_by_id(self, ingredient_id: int, user_id: int) -> float:
@@ -141,15 +652,77 @@ class SqliteManager:
         Returns:
             float - The quantity of ingredient.
         """
-        query = """
-            SELECT quantity 
-            FROM inventory 
-            WHERE user_id = ? AND ingredient_id = ?
-        """
-        res = await self.cur.execute(query, (user_id, ingredient_id))
-        table: Tuple[float] = await res.fetchone()
+        table: Tuple[float] = await self._read_one(_SQL_QUANTITY_BY_ID, (user_id, ingredient_id))
         return table[0] if table else 0.0
     
+    async def get_inventory_field(
+        self,
+        ingredient_id: int,
+        user_id: int,
+        field: Literal["quantity", "minimum_threshold", "expiration_date"]
+    ) -> Any:
+        """
+        Get a single column of the ingredient id from the user's inventory, without building a full Ingredient.
+
+        Args:
+            ingredient_id (int) - The id of the ingredient.
+            user_id (int) - The user's id in the database.
+            field (str) - One of "quantity", "minimum_threshold" or "expiration_date".
+        Returns:
+            Any - The value of the column, or None if the ingredient is not in the user's inventory.
+        Raises:
+            ValueError - If field is not one of the allowed inventory columns.
+        """
+        query = _SQL_INVENTORY_FIELD.get(field)
+        if query is None:
+            raise ValueError(f"Unknown inventory field {field!r}. Expected one of {sorted(_SQL_INVENTORY_FIELD)}.")
+        table = await self._read_one(query, (user_id, ingredient_id))
+        return table[0] if table else None
+
+    async def get_quantities_by_ids(self, ingredient_ids: Sequence[int], user_id: int) -> dict[int, float]:
+        """
+        Get the quantities of several ingredient ids from the user's inventory with a single query.
+
+        Ingredients that are not present in the user's inventory get a quantity of 0.0.
+
+        Args:
+            ingredient_ids (Sequence[int]) - The ids of the ingredients.
+            user_id (int) - The user's id in the database.
+        Returns:
+            dict[int, float] - The quantity of each ingredient, keyed by ingredient id.
+        """
+        return await self._read_quantities(_SQL_QUANTITIES_BY_IDS, ingredient_ids, user_id)
+
+    async def get_quantities_by_names(self, ingredient_names: Sequence[str], user_id: int) -> dict[str, float]:
+        """
+        Get the quantities of several ingredient names from the user's inventory with a single query.
+
+        Ingredients that are not present in the user's inventory get a quantity of 0.0.
+
+        Args:
+            ingredient_names (Sequence[str]) - The names of the ingredients.
+            user_id (int) - The user's id in the database.
+        Returns:
+            dict[str, float] - The quantity of each ingredient, keyed by ingredient name.
+        """
+        return await self._read_quantities(_SQL_QUANTITIES_BY_NAMES, ingredient_names, user_id)
+
+    async def _read_quantities(self, query: str, keys: Sequence, user_id: int) -> dict:
+        """
+        Run one of the `_SQL_QUANTITIES_BY_*` queries for all keys at once.
+
+        Args:
+            query (str) - The quantities query, taking the user id and a JSON array of keys.
+            keys (Sequence) - The ingredient ids or names to look up.
+            user_id (int) - The user's id in the database.
+        Returns:
+            dict - The quantity of each key, defaulting to 0.0.
+        """
+        quantities = {key: 0.0 for key in keys}
+        for key, quantity in await self._read_all(query, (user_id, json.dumps(list(keys)))):
+            quantities[key] = quantity
+        return quantities
+
     async def get_ingredient_measurement_unit_by_name(self, ingredient_name: str) -> str:
         """
         Get the measurement unit of the ingredient name provided from the `ingredients` table. 
@@ -162,16 +735,7 @@ class SqliteManager:
         Raises:
             IngredientNotFoundError - If the ingredient does not exist in the `ingredients` table.
         """
-        query = """
-            SELECT unit_type
-            FROM ingredients
-            WHERE name = ?
-        """
-        res = await self.cur.execute(query, (ingredient_name, ))
-        table: Tuple[str] = await res.fetchone()
-        if not table:
-            raise IngredientNotFoundError("Ingredient is not found inside the ingredients table")
-        return table[0]
+        return await self._read_unit(self._unit_by_name, _SQL_UNIT_BY_NAME, ingredient_name, "Ingredient is not found inside the ingredients table")
     
     async def get_ingredient_measurement_unit_by_id(self, ingredient_id: int) -> str:
         """
@@ -185,17 +749,73 @@ class SqliteManager:
         Raises:
             IngredientNotFoundError - If the ingredient does not exist in the `ingredients` table.
         """
-        query = """
-            SELECT unit_type
-            FROM ingredients
-            WHERE id = ?
-        """
-        res = await self.cur.execute(query, (ingredient_id, ))
-        table: Tuple[str] = await res.fetchone()
-        unit_type = table[0]
-        if not unit_type:
-            raise IngredientNotFoundError("Ingredient is not found inside the `ingredients` table")
-        return unit_type
+        return await self._read_unit(self._unit_by_id, _SQL_UNIT_BY_ID, ingredient_id, "Ingredient is not found inside the `ingredients` table")
+
+    async def _read_unit(self, cache: OrderedDict, query: str, key: str | int, not_found_message: str) -> str:
+        """
+        Read-through lookup of a measurement unit: serve it from the LRU cache, or query it and cache the result.
+        The not-found check runs before the row is unpacked, so a missing ingredient raises IngredientNotFoundError.
+
+        Args:
+            cache (OrderedDict) - The LRU cache keyed like `key`.
+            query (str) - The `_SQL_UNIT_BY_*` query taking `key` as its only parameter.
+            key (str | int) - The ingredient name or id.
+            not_found_message (str) - The message of the error raised when the ingredient does not exist.
+        Returns:
+            str - The measurement unit of the ingredient.
+        Raises:
+            IngredientNotFoundError - If the ingredient does not exist in the `ingredients` table.
+        """
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        table: Tuple[str] = await self._read_one(query, (key,))
+        if table is None:
+            raise IngredientNotFoundError(not_found_message)
+        self._cache_put(cache, key, table[0])
+        return table[0]
+
+    async def refresh_metadata(self) -> None:
+        """
+        Reload the ingredient metadata caches (measurement units and ids) from the `ingredients` table.
+        Call this after bulk changes to the `ingredients` table (e.g. from admin endpoints).
+
+        Args:
+            None.
+        Returns:
+            None.
+        """
+        self.invalidate_unit_cache()
+        for ingredient_id, ingredient_name, unit_type in await self._read_all(_SQL_INGREDIENT_UNITS, (UNIT_CACHE_SIZE,)):
+            self._cache_put(self._unit_by_id, ingredient_id, unit_type)
+            self._cache_put(self._unit_by_name, ingredient_name, unit_type)
+            self._cache_put(self._id_by_name, ingredient_name, ingredient_id)
+        logger.info(f"Loaded {len(self._unit_by_id)} measurement units into the cache.")
+
+    def invalidate_unit_cache(self, ingredient_name: str | None = None, ingredient_id: int | None = None) -> None:
+        """
+        Drop cached ingredient metadata. Call this whenever an ingredient's `unit_type` changes
+        or an ingredient is removed from the `ingredients` table.
+
+        If neither argument is given, all metadata caches are cleared.
+
+        Args:
+            ingredient_name (str | None) - The name of the ingredient to invalidate.
+            ingredient_id (int | None) - The id of the ingredient to invalidate.
+        Returns:
+            None.
+        """
+        if ingredient_name is None and ingredient_id is None:
+            self._unit_by_name.clear()
+            self._unit_by_id.clear()
+            self._id_by_name.clear()
+            return
+        if ingredient_name is not None:
+            self._unit_by_name.pop(ingredient_name, None)
+            self._id_by_name.pop(ingredient_name, None)
+        if ingredient_id is not None:
+            self._unit_by_id.pop(ingredient_id, None)
     
     async def get_ingredient_info_by_name(self, ingredient_name: str, user_id: int) -> Ingredient:
         """
@@ -213,27 +833,7 @@ class SqliteManager:
         Returns:
             Ingredient - The Ingredient class to return.
         """
-        query = """
-                SELECT t1.name, t1.category, t1.unit_type, t2.quantity, t2.minimum_threshold, t2.expiration_date
-                FROM ingredients t1
-                RIGHT JOIN inventory t2
-                ON t1.id = t2.ingredient_id
-                WHERE t1.name = ? AND t2.user_id = ?
-        """
-        res = await self.cur.execute(query, (ingredient_name, user_id))
-        table = await res.fetchone()
-        if table:
-            name, category, unit_type, quantity, minimum_threshold, expiration_date = table
-            return Ingredient(
-                name=name,
-                category=category,
-                unit_type=unit_type,
-                quantity=quantity,
-                minimum_threshold=minimum_threshold,
-                expiration_date=expiration_date
-            )
-        else:
-            return None
+        return await self._fetch_info(_SQL_INFO_BY_NAME, (ingredient_name, user_id))
 
     async def get_ingredient_info_by_id(self, ingredient_id: int, user_id: int) -> Ingredient:
         """
@@ -251,28 +851,73 @@ class SqliteManager:
         Returns:
             Ingredient - The Ingredient class to return.
         """
-        query = """
-                SELECT t1.name, t1.category, t1.unit_type, t2.quantity, t2.minimum_threshold, t2.expiration_date
-                FROM ingredients t1
-                RIGHT JOIN inventory t2
-                ON t1.id = t2.ingredient_id
-                WHERE t1.id = ? AND t2.user_id = ?
-        """
-        res = await self.cur.execute(query, (ingredient_id, user_id))
-        table = await res.fetchone()
-        if table:
-            name, category, unit_type, quantity, minimum_threshold, expiration_date = table
-            return Ingredient(
-                name=name,
-                category=category,
-                unit_type=unit_type,
-                quantity=quantity,
-                minimum_threshold=minimum_threshold,
-                expiration_date=expiration_date
-            )
-        else:
-            return None
+        return await self._fetch_info(_SQL_INFO_BY_ID, (ingredient_id, user_id))
     
+    async def get_ingredient_info_bulk(self, ingredient_names: list[str], user_id: int) -> dict[str, Ingredient]:
+        """
+        Get the information of several ingredients in the user's inventory with a single query.
+
+        Ingredients that are not in the user's inventory are left out of the result.
+
+        Args:
+            ingredient_names (list[str]) - The names of the ingredients.
+            user_id (int) - The user's id in the database.
+        Returns:
+            dict[str, Ingredient] - The Ingredient of each name found, keyed by ingredient name.
+        """
+        rows = await self._read_all(_SQL_INFO_BULK_BY_NAMES, (user_id, json.dumps(list(ingredient_names))))
+        return {row["name"]: Ingredient(**dict(row)) for row in rows}
+
+    async def _fetch_info(self, query: str, params: tuple) -> Ingredient | None:
+        """
+        Run one of the `_SQL_INFO_BY_*` queries and build an Ingredient from the first row.
+
+        Args:
+            query (str) - The info query to run.
+            params (tuple) - The parameters bound to the query.
+        Returns:
+            Ingredient | None - The ingredient, or None if no row matched.
+        """
+        table = await self._read_one(query, params)
+        if not table:
+            return None
+        return Ingredient(**dict(table))
+
+    async def get_ingredient_ids_by_names(self, ingredient_names: Sequence[str]) -> dict[str, int]:
+        """
+        Get the ids of several ingredients in the `ingredients` table with a single query.
+        Cached ids are served from memory; the rest are looked up with a single query.
+        Names that do not exist in the `ingredients` table are left out of the result.
+
+        Args:
+            ingredient_names (Sequence[str]) - The names of the ingredients.
+        Returns:
+            dict[str, int] - The id of each name found, keyed by ingredient name.
+        """
+        ingredient_ids = {name: self._id_by_name[name] for name in ingredient_names if name in self._id_by_name}
+        missing = [name for name in dict.fromkeys(ingredient_names) if name not in ingredient_ids]
+        if missing:
+            async with self.acquire_read() as conn:
+                fetched = await self._fetch_ingredient_ids(conn, missing)
+            for name, ingredient_id in fetched.items():
+                self._cache_put(self._id_by_name, name, ingredient_id)
+            ingredient_ids.update(fetched)
+        return ingredient_ids
+
+    @staticmethod
+    async def _fetch_ingredient_ids(conn: aiosqlite.Connection, ingredient_names: Sequence[str]) -> dict[str, int]:
+        """
+        Look up ingredient ids by name on the given connection with a single query.
+
+        Args:
+            conn (aiosqlite.Connection) - The connection to run the lookups on.
+            ingredient_names (Sequence[str]) - The names of the ingredients.
+        Returns:
+            dict[str, int] - The id of each name found, keyed by ingredient name.
+        """
+        rows = await conn.execute_fetchall(_SQL_INGREDIENT_IDS_BY_NAMES, (json.dumps(list(ingredient_names)),))
+        return {name: ingredient_id for ingredient_id, name in rows}
+
     async def get_ingredient_id_by_name(self, ingredient_name: str) -> int | None:
         """
         Get the id of the ingredient name provided in the `ingredients` table.
@@ -284,15 +929,14 @@ class SqliteManager:
         Raises:
             IngredientNotFoundError - If the ingredient does not exist in the `ingredients` table.
         """
-        query = """
-                SELECT id
-                FROM ingredients
-                WHERE name = ?
-        """
-        res = await self.cur.execute(query, (ingredient_name,))
-        table: Tuple[int] = await res.fetchone()
+        if ingredient_name in self._id_by_name:
+            self._id_by_name.move_to_end(ingredient_name)
+            return self._id_by_name[ingredient_name]
+
+        table: Tuple[int] = await self._read_one(_SQL_INGREDIENT_ID_BY_NAME, (ingredient_name,))
         if not table:
             raise IngredientNotFoundError(f"Ingredient {ingredient_name} not found in the `ingredients` table.")
+        self._cache_put(self._id_by_name, ingredient_name, table[0])
         return table[0]
         
     async def ingredient_exists_in_inventory_by_name(self, ingredient_name: str, user_id: int) -> bool:
@@ -304,16 +948,7 @@ class SqliteManager:
         Returns:
             bool - True if the ingredient exists in the user's inventory, False otherwise.
         """
-        query = """
-                SELECT COUNT(*) 
-                FROM inventory t1
-                INNER JOIN ingredients t2
-                ON t1.ingredient_id = t2.id
-                WHERE t1.user_id = ? AND t2.name = ?
-        """
-        res = await self.cur.execute(query, (user_id, ingredient_name))
-        exists: Tuple[int] = await res.fetchone()
-        return exists[0] > 0
+        return await self._read_one(_SQL_EXISTS_IN_INVENTORY_BY_NAME, (user_id, ingredient_name)) is not None
 
     async def ingredient_exists_in_inventory_by_id(self, ingredient_id: int, user_id: int) -> bool:
         """
@@ -325,16 +960,7 @@ class SqliteManager:
         Returns:
             bool - True if the ingredient exists in the user's inventory, False otherwise.
         """
-        query = """
-                SELECT COUNT(*) 
-                FROM inventory t1
-                INNER JOIN ingredients t2
-                ON t1.ingredient_id = t2.id
-                WHERE t1.user_id = ? AND t2.id = ?
-        """
-        res = await self.cur.execute(query, (user_id, ingredient_id))
-        exists: Tuple[int] = await res.fetchone()
-        return exists[0] > 0
+        return await self._read_one(_SQL_EXISTS_IN_INVENTORY_BY_ID, (user_id, ingredient_id)) is not None
     
     async def ingredient_exists_in_ingredients_by_name(self, ingredient_name: str) -> bool:
         """
@@ -345,14 +971,10 @@ class SqliteManager:
         Returns:
             bool - True if the ingredient exists in the `ingredients` table, False otherwise.
         """
-        query = """
-                SELECT COUNT(*) 
-                FROM ingredients 
-                WHERE name = ?
-        """
-        res = await self.cur.execute(query, (ingredient_name,))
-        exists: Tuple[int] = await res.fetchone()
-        return exists[0] > 0
+        # Only hits are cached; a miss may be inserted at any time
+        if ingredient_name in self._id_by_name or ingredient_name in self._unit_by_name:
+            return True
+        return await self._read_one(_SQL_EXISTS_IN_INGREDIENTS_BY_NAME, (ingredient_name,)) is not None
     
     async def ingredient_exists_in_ingredients_by_id(self, ingredient_id: int) -> bool:
         """
@@ -362,14 +984,9 @@ class SqliteManager:
         Returns:
             bool - True if the ingredient exists in the `ingredients` table, False otherwise.
         """
-        query = """
-                SELECT COUNT(*) 
-                FROM ingredients 
-                WHERE id = ?
-        """
-        res = await self.cur.execute(query, (ingredient_id,))
-        exists: Tuple[int] = await res.fetchone()
-        return exists[0] > 0
+        if ingredient_id in self._unit_by_id:
+            return True
+        return await self._read_one(_SQL_EXISTS_IN_INGREDIENTS_BY_ID, (ingredient_id,)) is not None
 
     async def add_ingredient_to_ingredients(self, ingredient: IngredientInsertion) -> int:
         """
@@ -384,19 +1001,17 @@ class SqliteManager:
             IngredientAlreadyExistsInIngredientsError - If the ingredient already exists in the `ingredients` table.
             IngredientInsertionError - If there is an error inserting the ingredient into the `ingredients` table.
         """
-        if await self.ingredient_exists_in_ingredients_by_name(ingredient.name):
+        # ON CONFLICT DO NOTHING returns no row for an existing name, which replaces a separate existence check
+        async with self.transaction() as conn:
+            inserted = await conn.execute_fetchall(_SQL_INSERT_INGREDIENT, (ingredient.name, ingredient.category, ingredient.unit_type))
+        if not inserted:
             raise IngredientAlreadyExistsInIngredientsError(f"Ingredient {ingredient.name} already exists in the `ingredients` table.")
-        
-        query = """
-            INSERT INTO ingredients (name, category, unit_type)
-            VALUES (?, ?, ?)
-        """
-        await self.cur.execute(query, (ingredient.name, ingredient.category, ingredient.unit_type))
-        last_row_id = self.cur.lastrowid
-        await self.conn.commit()
+        last_row_id = inserted[0][0]
         if not last_row_id:
-            await self.conn.rollback()
             raise IngredientInsertionError(f"Error inserting ingredient {ingredient.name} into the `ingredients` table.")
+        self._cache_put(self._id_by_name, ingredient.name, last_row_id)
+        self._cache_put(self._unit_by_name, ingredient.name, ingredient.unit_type)
+        self._cache_put(self._unit_by_id, last_row_id, ingredient.unit_type)
         logger.info(f"Added ingredient {ingredient.name} into the `ingredients` table with id {last_row_id}.")
         return last_row_id
         
@@ -416,59 +1031,54 @@ class SqliteManager:
             IngredientInsertionError - If there is an error inserting the ingredient into the `inventory` table.
             IngredientAlreadyExistsInInventoryError - If the ingredient already exists in the `inventory` table for the user.
         """
-        if await self.ingredient_exists_in_inventory_by_id(ingredient_id, user_id):
+        # ON CONFLICT DO NOTHING returns no row if the user already has the ingredient, which replaces a separate existence check.
+        # RETURNING hands back the timestamps and the ingredient's details, so no follow-up SELECTs are needed.
+        async with self.transaction() as conn:
+            inserted = await conn.execute_fetchall(_SQL_INSERT_INVENTORY, (user_id, ingredient_id, inventory_insertion.quantity, inventory_insertion.minimum_threshold, inventory_insertion.expiration_date))
+        if not inserted:
             raise IngredientAlreadyExistsInInventoryError(f"Ingredient with id {ingredient_id} already exists in the inventory for user {user_id}.")
-        
-        query = """
-            INSERT INTO inventory (user_id, ingredient_id, quantity, minimum_threshold, expiration_date)
-            VALUES (?, ?, ?, ?, ?)
-        """
-        await self.cur.execute(query, (user_id, ingredient_id, inventory_insertion.quantity, inventory_insertion.minimum_threshold, inventory_insertion.expiration_date))
-        last_row_id = self.cur.lastrowid
-        await self.conn.commit()
-        if not last_row_id:
-            await self.conn.rollback()
+        row = inserted[0]
+        if not row["inventory_id"]:
             raise IngredientInsertionError(f"Error inserting ingredient with id {ingredient_id} into the `inventory` table.")
-
-        # Fetch the created_at and updated_at timestamps
-        created_updated_timings_query = """
-                                        SELECT created_at, updated_at
-                                        FROM inventory
-                                        WHERE id = ?
-                                    """
-        created_updated_res = await self.cur.execute(created_updated_timings_query, (last_row_id,))
-        created_updated_table: Tuple[str, str] = await created_updated_res.fetchone()
-        if not created_updated_table:
-            raise IngredientInsertionError(f"Error fetching created_at and updated_at for ingredient with id {ingredient_id} in the `inventory` table.")
-        
-        created_at, updated_at = created_updated_table
-
-        # Fetch the name, category, and unit_type from the ingredients table
-        ingredient_info_query = """
-                                    SELECT name, category, unit_type
-                                    FROM ingredients
-                                    WHERE id = ?
-                                """
-        ingredient_info_res = await self.cur.execute(ingredient_info_query, (ingredient_id,))
-        ingredient_info_table: Tuple[str, str, str] = await ingredient_info_res.fetchone()
-        if not ingredient_info_table:
-            raise IngredientInsertionError(f"Error fetching ingredient info for ingredient with id {ingredient_id} in the `ingredients` table.")
-        name, category, unit_type = ingredient_info_table
-        logger.info(f"Added ingredient {name} with id {ingredient_id} into the `inventory` table with id {last_row_id} for user {user_id}.")
-        return IngredientFullResponse(
-            ingredient_id=ingredient_id,
-            inventory_id=last_row_id,
-            user_id=user_id,
-            created_at=created_at,
-            updated_at=updated_at,
-            name=name,
-            category=category,
-            unit_type=unit_type,
-            quantity=inventory_insertion.quantity,
-            minimum_threshold=inventory_insertion.minimum_threshold,
-            expiration_date=inventory_insertion.expiration_date
-        )
+        logger.info(f"Added ingredient {row['name']} with id {ingredient_id} into the `inventory` table with id {row['inventory_id']} for user {user_id}.")
+        return IngredientFullResponse.model_validate(dict(row))
     
+    async def add_ingredient_with_inventory(self, user_id: int, ingredient: IngredientInsertion, inventory_insertion: InventoryInsertion) -> IngredientFullResponse:
+        """
+        Add an ingredient into the user's inventory in one transaction, first creating it in the `ingredients` table
+        if it does not exist yet. Return IngredientFullResponse object.
+
+        Args:
+            user_id (int) - The user's id in the database.
+            ingredient (IngredientInsertion) - The ingredient to be added. Ignored if the name already exists.
+            inventory_insertion (InventoryInsertion) - The inventory insertion data.
+        Returns:
+            IngredientFullResponse - The metadata of the ingredient insertion.
+        Raises:
+            IngredientAlreadyExistsInInventoryError - If the ingredient already exists in the `inventory` table for the user.
+            IngredientInsertionError - If there is an error inserting the ingredient into either table.
+        """
+        # Known ingredients resolve from the id cache without touching SQLite
+        ingredient_id = self._id_by_name.get(ingredient.name)
+        # A duplicate is an expected client error, so it is caught on a reader before the transaction opens
+        # instead of rolling back the writer. The insert still reports a duplicate that races this check.
+        if ingredient_id is not None:
+            exists = await self.ingredient_exists_in_inventory_by_id(ingredient_id, user_id)
+        else:
+            exists = await self.ingredient_exists_in_inventory_by_name(ingredient.name, user_id)
+        if exists:
+            raise IngredientAlreadyExistsInInventoryError(f"Ingredient {ingredient.name} already exists in the inventory for user {user_id}.")
+
+        async with self.transaction() as conn:
+            if ingredient_id is None:
+                try:
+                    ingredient_id = await self.add_ingredient_to_ingredients(ingredient)
+                except IngredientAlreadyExistsInIngredientsError:
+                    # Read on the writer, inside the transaction, so the row cannot change underneath us
+                    (ingredient_id,), = await conn.execute_fetchall(_SQL_INGREDIENT_ID_BY_NAME, (ingredient.name,))
+                    self._cache_put(self._id_by_name, ingredient.name, ingredient_id)
+            return await self.add_ingredient_into_inventory(user_id, ingredient_id, inventory_insertion)
+
     async def delete_ingredient_from_inventory_by_id(self, ingredient_id: int, user_id: int) -> bool:
         """
         Delete an ingredient from the `inventory` table by ingredient id and user id.
@@ -478,22 +1088,17 @@ class SqliteManager:
             user_id (int) - The user's id in the database.
         
         Returns:
-            bool - True if the ingredient was deleted successfully, False otherwise.
+            bool - True if the ingredient was deleted successfully.
         
         Raises:
             InventoryDeletionError - If the ingredient id does not exist in the `inventory` table for the user.
         """
-        if not await self.ingredient_exists_in_inventory_by_id(ingredient_id, user_id):
+        async with self.transaction() as conn:
+            async with conn.execute(_SQL_DELETE_INVENTORY_BY_ID, (ingredient_id, user_id)) as cur:
+                rowcount = cur.rowcount
+        # No deleted row means the ingredient was not in the user's inventory
+        if rowcount == 0:
             raise InventoryDeletionError(f"Ingredient with id {ingredient_id} does not exist in the inventory for user {user_id}.")
-        
-        query = """
-            DELETE FROM inventory 
-            WHERE ingredient_id = ? AND user_id = ?
-        """
-        await self.cur.execute(query, (ingredient_id, user_id))
-        await self.conn.commit()
-        if self.cur.rowcount == 0:
-            return False
         logger.info(f"Deleted ingredient with id {ingredient_id} from the inventory for user {user_id}.")
         return True
 
@@ -506,25 +1111,18 @@ class SqliteManager:
             user_id (int) - The user's id in the database.
         
         Returns:
-            bool - True if the ingredient was deleted successfully, False otherwise.
+            bool - True if the ingredient was deleted successfully.
         
         Raises:
             InventoryDeletionError - If the ingredient name does not exist in the `inventory` table for the user.
         """
-        if not await self.ingredient_exists_in_inventory_by_name(ingredient_name, user_id):
-            raise InventoryDeletionError(f"Ingredient {ingredient_name} does not exist in the inventory for user {user_id}.")
-        
-        query = """
-            DELETE FROM inventory 
-            WHERE user_id = ? AND ingredient_id = (
-                SELECT id FROM ingredients WHERE name = ?
-            )
-        """
-        await self.cur.execute(query, (user_id, ingredient_name))
-        await self.conn.commit()
+        async with self.transaction() as conn:
+            async with conn.execute(_SQL_DELETE_INVENTORY_BY_NAME, (user_id, ingredient_name)) as cur:
+                rowcount = cur.rowcount
 
-        if self.cur.rowcount == 0:
-            return False
+        # No deleted row means the ingredient was not in the user's inventory
+        if rowcount == 0:
+            raise InventoryDeletionError(f"Ingredient {ingredient_name} does not exist in the inventory for user {user_id}.")
         logger.info(f"Deleted ingredient {ingredient_name} from the inventory for user {user_id}.")
         return True
 
@@ -541,67 +1139,19 @@ class SqliteManager:
             IngredientFullResponse - The updated ingredient information.
         
         Raises:
-            InventoryUpdateError - If the ingredient does not exist in the inventory table.
+            InventoryUpdateError - If the updates have unknown fields or nothing to update.
+            IngredientNotFoundError - If the ingredient does not exist in the inventory table.
         """
-        # Check if the ingredient exists in the inventory
-        if not await self.ingredient_exists_in_inventory_by_id(ingredient_id, user_id):
-            raise InventoryUpdateError(f"Ingredient with id {ingredient_id} does not exist in the inventory for user {user_id}.")
-        
-        # Prepare the update query
-        update_fields = []
-        update_values = []
+        fields, update_values = self._inventory_update_fields(updates)
+        async with self.transaction() as conn:
+            updated = await conn.execute_fetchall(_SQL_UPDATE_INVENTORY_BY_ID[fields], (*update_values, user_id, ingredient_id))
 
-        for key, value in updates.items():
-            if value is not None:
-                update_fields.append(f"{key} = ?")
-                update_values.append(value)
-
-        if not update_fields:
-            raise InventoryUpdateError("No fields to update. At least one field must be provided for update.")
-    
-
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-        update_values.extend([user_id, ingredient_id])
-
-        query = f"""
-            UPDATE inventory
-            SET {', '.join(update_fields)}
-            WHERE user_id = ? AND ingredient_id = ?
-        """
-        await self.cur.execute(query, update_values)
-        await self.conn.commit()
-
-        if self.cur.rowcount == 0:
-            raise InventoryUpdateError(f"Failed to update ingredient with id {ingredient_id} in the inventory for user {user_id}.")
-        
-        # Fetch the updated ingredient information
-        updated_info_query = """
-            SELECT t1.name, t1.category, t1.unit_type, t2.id, t2.quantity, t2.minimum_threshold, t2.expiration_date, t2.created_at, t2.updated_at
-            FROM ingredients t1
-            INNER JOIN inventory t2
-            ON t1.id = t2.ingredient_id
-            WHERE t1.id = ? AND t2.user_id = ?
-        """
-        updated_info_res = await self.cur.execute(updated_info_query, (ingredient_id, user_id))
-        updated_info_table = await updated_info_res.fetchone()
-        if not updated_info_table:
-            raise InventoryUpdateError(f"Error fetching updated ingredient info for ingredient with id {ingredient_id} in the inventory for user {user_id}.")
-        ingredient_name, category, unit_type, inventory_id, quantity, minimum_threshold, expiration_date, created_at, updated_at = updated_info_table
+        # No updated row means the ingredient was not in the user's inventory
+        if not updated:
+            raise IngredientNotFoundError(f"Ingredient with id {ingredient_id} does not exist in the inventory for user {user_id}.")
 
         logger.info(f"Updated ingredient with id {ingredient_id} in the inventory for user {user_id}.")
-        return IngredientFullResponse(
-            ingredient_id=ingredient_id,
-            inventory_id=inventory_id,
-            user_id=user_id,
-            created_at=created_at,
-            updated_at=updated_at,
-            name=ingredient_name,
-            category=category,
-            unit_type=unit_type,
-            quantity=quantity,
-            minimum_threshold=minimum_threshold,
-            expiration_date=expiration_date
-        )
+        return IngredientFullResponse.model_validate(dict(updated[0]))
     
     async def update_ingredient_in_inventory_by_name(self, ingredient_name: str, user_id: int, updates: dict) -> IngredientFullResponse:
         """
@@ -616,107 +1166,153 @@ class SqliteManager:
             IngredientFullResponse - The updated ingredient information.
         
         Raises:
-            InventoryUpdateError - If the ingredient does not exist in the inventory table.
+            InventoryUpdateError - If the updates have unknown fields or nothing to update.
+            IngredientNotFoundError - If the ingredient does not exist in the inventory table.
         """
-        # Check if the ingredient exists in the inventory
-        if not await self.ingredient_exists_in_inventory_by_name(ingredient_name, user_id):
-            raise InventoryUpdateError(f"Ingredient {ingredient_name} does not exist in the inventory for user {user_id}.")
-        
-        # Prepare the update query
-        update_fields = []
-        update_values = []
+        fields, update_values = self._inventory_update_fields(updates)
+        async with self.transaction() as conn:
+            updated = await conn.execute_fetchall(_SQL_UPDATE_INVENTORY_BY_NAME[fields], (*update_values, user_id, ingredient_name))
 
-        for key, value in updates.items():
-            if value is not None:
-                update_fields.append(f"{key} = ?")
-                update_values.append(value)
+        # No updated row means the ingredient was not in the user's inventory
+        if not updated:
+            raise IngredientNotFoundError(f"Ingredient {ingredient_name} does not exist in the inventory for user {user_id}.")
 
-        if not update_fields:
+        logger.info(f"Updated ingredient {ingredient_name} in the inventory for user {user_id}.")
+        return IngredientFullResponse.model_validate(dict(updated[0]))
+
+    @staticmethod
+    def _inventory_update_fields(updates: dict) -> Tuple[tuple[str, ...], list]:
+        """
+        Pick the fields to set for an inventory update, in INVENTORY_FIELDS order, and their values. `None` values are skipped.
+
+        Args:
+            updates (dict) - The updates to be made to the ingredient.
+        Returns:
+            Tuple[tuple[str, ...], list] - The key into the `_SQL_UPDATE_INVENTORY_BY_*` templates and its parameter values.
+        Raises:
+            InventoryUpdateError - If a key is not an updatable inventory field, or nothing is left to update.
+        """
+        unknown = updates.keys() - set(INVENTORY_FIELDS)
+        if unknown:
+            raise InventoryUpdateError(f"Unknown inventory fields {sorted(unknown)}. Expected one of {list(INVENTORY_FIELDS)}.")
+
+        fields = tuple(field for field in INVENTORY_FIELDS if updates.get(field) is not None)
+        if not fields:
             raise InventoryUpdateError("No fields to update. At least one field must be provided for update.")
-        
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-        update_values.extend([user_id, ingredient_name])
+        return fields, [updates[field] for field in fields]
 
-        query = f"""
-            UPDATE inventory
-            SET {', '.join(update_fields)}
-            WHERE user_id = ? AND ingredient_id = (
-                SELECT id FROM ingredients WHERE name = ?
-            )
+    async def bulk_upsert_inventory(self, rows: list[tuple[int, int, float, float, str | None]]) -> None:
         """
-        await self.cur.execute(query, update_values)
-        await self.conn.commit()
+        Insert or update many rows of the `inventory` table in a single transaction.
 
-        if self.cur.rowcount == 0:
-            raise InventoryUpdateError(f"Failed to update ingredient {ingredient_name} in the inventory for user {user_id}.")
-        
-        # Fetch the updated ingredient information
-        updated_info_query = """
-            SELECT t1.id, t1.name, t1.category, t1.unit_type, t2.id, t2.quantity, t2.minimum_threshold, t2.expiration_date, t2.created_at, t2.updated_at
-            FROM ingredients t1
-            INNER JOIN inventory t2
-            ON t1.id = t2.ingredient_id
-            WHERE t1.name = ? AND t2.user_id = ?
-        """
-        updated_info_res = await self.cur.execute(updated_info_query, (ingredient_name, user_id))
-        updated_info_table = await updated_info_res.fetchone()
-        if not updated_info_table:
-            raise InventoryUpdateError(f"Error fetching updated ingredient info for ingredient {ingredient_name} in the inventory for user {user_id}.")
-        ingredient_id, name, category, unit_type, inventory_id, quantity, minimum_threshold, expiration_date, created_at, updated_at = updated_info_table
+        Rows whose (user_id, ingredient_id) already exist have their quantity, minimum_threshold
+        and expiration_date overwritten.
 
-        logger.info(f"Updated ingredient {ingredient_name} in the inventory for user {user_id}.")
-        return IngredientFullResponse(
-            ingredient_id=ingredient_id,
-            inventory_id=inventory_id,
-            user_id=user_id,
-            created_at=created_at,
-            updated_at=updated_at,
-            name=name,
-            category=category,
-            unit_type=unit_type,
-            quantity=quantity,
-            minimum_threshold=minimum_threshold,
-            expiration_date=expiration_date
-        )
-    
-    async def get_all_ingredients_in_inventory(self, user_id: int) -> list[IngredientFullResponse]:
+        Args:
+            rows (list[tuple]) - (user_id, ingredient_id, quantity, minimum_threshold, expiration_date) tuples.
+        Returns:
+            None.
         """
-        Get all ingredients in the inventory for a given user id.
-        
+        async with self.transaction() as conn:
+            await conn.executemany(_SQL_UPSERT_INVENTORY, rows)
+        logger.info(f"Upserted {len(rows)} rows into the `inventory` table.")
+
+    async def add_ingredients_bulk(self, ingredients: list[IngredientInsertion]) -> int:
+        """
+        Add many ingredients into the `ingredients` table in a single transaction.
+        Ingredients whose name already exists are skipped.
+
+        Args:
+            ingredients (list[IngredientInsertion]) - The ingredients to be added.
+        Returns:
+            int - The number of ingredients actually inserted.
+        """
+        rows = [(ingredient.name, ingredient.category, ingredient.unit_type) for ingredient in ingredients]
+        async with self.transaction() as conn:
+            async with conn.executemany(_SQL_INSERT_INGREDIENTS_BULK, rows) as cur:
+                inserted = cur.rowcount
+        logger.info(f"Added {inserted} of {len(rows)} ingredients into the `ingredients` table.")
+        return inserted
+
+    async def add_inventory_bulk(self, user_id: int, items: dict[str, InventoryInsertion]) -> int:
+        """
+        Add many ingredients into the user's inventory in a single transaction.
+        Ingredient names are resolved to ids with a single query.
+        Ingredients already in the user's inventory are skipped.
+
         Args:
             user_id (int) - The user's id in the database.
-        
+            items (dict[str, InventoryInsertion]) - The inventory insertion data, keyed by ingredient name.
         Returns:
-            list[IngredientFullResponse] - A list of IngredientFullResponse objects containing ingredient information.
+            int - The number of rows actually inserted.
+        Raises:
+            IngredientNotFoundError - If any of the names does not exist in the `ingredients` table. Nothing is inserted.
         """
-        query = """
-            SELECT t1.id, t1.name, t1.category, t1.unit_type, t2.id, t2.quantity, t2.minimum_threshold, t2.expiration_date, t2.created_at, t2.updated_at
-            FROM ingredients t1
-            INNER JOIN inventory t2
-            ON t1.id = t2.ingredient_id
-            WHERE t2.user_id = ?
+        names = list(items)
+        async with self.transaction() as conn:
+            # Resolved on the writer so ingredients added earlier in the same transaction are found
+            ingredient_ids = await self._fetch_ingredient_ids(conn, names)
+            missing = [name for name in names if name not in ingredient_ids]
+            if missing:
+                raise IngredientNotFoundError(f"Ingredients {missing} not found in the `ingredients` table.")
+
+            rows = [
+                (user_id, ingredient_ids[name], item.quantity, item.minimum_threshold, item.expiration_date)
+                for name, item in items.items()
+            ]
+            async with conn.executemany(_SQL_INSERT_INVENTORY_BULK, rows) as cur:
+                inserted = cur.rowcount
+        logger.info(f"Added {inserted} of {len(rows)} ingredients into the inventory for user {user_id}.")
+        return inserted
+
+    async def import_ingredients(self, user_id: int, ingredients: list[Ingredient]) -> int:
         """
-        res = await self.cur.execute(query, (user_id,))
-        rows = await res.fetchall()
-        
-        ingredients = []
-        for row in rows:
-            ingredient_id, name, category, unit_type, inventory_id, quantity, minimum_threshold, expiration_date, created_at, updated_at = row
-            ingredients.append(IngredientFullResponse(
-                ingredient_id=ingredient_id,
-                inventory_id=inventory_id,
-                user_id=user_id,
-                created_at=created_at,
-                updated_at=updated_at,
-                name=name,
-                category=category,
-                unit_type=unit_type,
-                quantity=quantity,
-                minimum_threshold=minimum_threshold,
-                expiration_date=expiration_date
-            ))
-        
-        return ingredients
-        
+        Add many ingredients into both the `ingredients` table and the user's inventory in a single transaction,
+        e.g. when importing a shopping list. Ingredients that are new to the `ingredients` table are created first.
+        Ingredients already in the user's inventory are skipped.
+
+        Args:
+            user_id (int) - The user's id in the database.
+            ingredients (list[Ingredient]) - The ingredients to be added.
+        Returns:
+            int - The number of rows actually inserted into the inventory.
+        """
+        async with self.transaction():
+            await self.add_ingredients_bulk([
+                IngredientInsertion(name=ingredient.name, category=ingredient.category, unit_type=ingredient.unit_type)
+                for ingredient in ingredients
+            ])
+            return await self.add_inventory_bulk(user_id, {
+                ingredient.name: InventoryInsertion(
+                    quantity=ingredient.quantity,
+                    minimum_threshold=ingredient.minimum_threshold,
+                    expiration_date=ingredient.expiration_date
+                )
+                for ingredient in ingredients
+            })
+
+    async def iter_ingredients_in_inventory(self, user_id: int, chunk_size: int = FETCH_CHUNK_SIZE) -> AsyncIterator[IngredientFullResponse]:
+        """
+        Stream all ingredients in the inventory for a given user id, `chunk_size` rows at a time, ordered by ingredient id.
+        Only one chunk of rows is held in memory, however large the inventory is.
 
+        Each chunk is a separate keyset query on a pooled connection that goes back to the pool before the rows
+        are yielded, so a slow consumer (e.g. a client downloading a streamed response) never holds a reader.
+        The trade-off is that chunks are separate reads: a write between two chunks can show up in the later one.
 
+        Args:
+            user_id (int) - The user's id in the database.
+            chunk_size (int) - The number of rows fetched per query.
+        Returns:
+            AsyncIterator[IngredientFullResponse] - The ingredients, in ingredient id order.
+        """
+        last_ingredient_id = 0
+        while True:
+            rows = await self._read_all(_SQL_INVENTORY_PAGE, (user_id, last_ingredient_id, chunk_size))
+            for row in rows:
+                # model_validate on the row dict skips building keyword arguments per row. Validation is kept on purpose:
+                # it turns the stored TEXT timestamps and enum strings into the model's types for serialization.
+                yield IngredientFullResponse.model_validate(dict(row))
+            if len(rows) < chunk_size:
+                return
+            last_ingredient_id = rows[-1]["ingredient_id"]
@@ -1,8 +1,8 @@
-from pydantic import BaseModel, Field, field_validator
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from enum import StrEnum
 from datetime import date, datetime
 
-class Category(str, Enum):
+class Category(StrEnum):
     staple = "staple"
     dairy = "dairy"
     protein = "protein"
@@ -10,7 +10,7 @@ class Category(str, Enum):
     produce = "produce"
     others = "others"
 
-class MeasurementUnit(str, Enum):
+class MeasurementUnit(StrEnum):
     grams = "grams"
     millilitres = "millilitres"
     pieces = "pieces"
@@ -20,6 +20,9 @@ class IngredientInsertion(BaseModel):
     category: Category
     unit_type: MeasurementUnit
 
+    # Keep the validated enum values as plain strings, so they bind to SQLite and cache without conversion
+    model_config = ConfigDict(use_enum_values=True)
+
 class InventoryInsertion(BaseModel):
     quantity: float = Field(..., ge=0)
     minimum_threshold: float = Field(..., ge=0)
@@ -30,13 +33,20 @@ class InventoryUpdate(BaseModel):
     minimum_threshold: float | None = Field(default=None, ge=0)
     expiration_date: date | None = None # e.g."2023-10-01"
 
-    class Config:
-        # This validates that at least one field is provided for update
-        @field_validator('__root__')
-        def at_least_one_field(cls, values):
-            if not any(v is not None for v in values.values()):
-                raise ValueError('At least one field must be provided for update')
-            return values        
+    # This validates that at least one field is provided for update.
+    # mode='after' runs once on the already-coerced instance instead of per field.
+    @model_validator(mode='after')
+    def at_least_one_field(self):
+        if self.quantity is None and self.minimum_threshold is None and self.expiration_date is None:
+            raise ValueError('At least one field must be provided for update')
+        return self
+
+# Upper bound on the names in one lookup, so a single request cannot bind an arbitrarily large json_each payload
+MAX_LOOKUP_NAMES = 500
+
+class IngredientLookup(BaseModel):
+    """Names of the ingredients to look up in one request."""
+    names: list[str] = Field(..., min_length=1, max_length=MAX_LOOKUP_NAMES)
 
 class Ingredient(IngredientInsertion, InventoryInsertion):
     """Represents an ingredient in the inventory + ingredeint table."""
@@ -49,5 +59,4 @@ class IngredientFullResponse(IngredientInsertion, InventoryInsertion):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
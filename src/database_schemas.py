@@ -15,6 +15,8 @@ ingredients_schema = """CREATE TABLE IF NOT EXISTS ingredients (
                         );
                     """
 
+# UNIQUE(user_id, ingredient_id) doubles as the composite index for every inventory lookup,
+# and UNIQUE(name) on ingredients is the index for lookups by ingredient name.
 inventory_schema = """CREATE TABLE IF NOT EXISTS inventory (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         user_id INTEGER NOT NULL,
@@ -30,6 +32,13 @@ inventory_schema = """CREATE TABLE IF NOT EXISTS inventory (
                     );
 """
 
+# Covering index for the per-user quantity/threshold/expiry lookups, so they are answered from the index
+# without a second seek into the inventory table. The read queries name it with INDEXED BY, since the
+# planner otherwise picks the UNIQUE(user_id, ingredient_id) index for full-key equality lookups.
+inventory_indexes_schema = """CREATE INDEX IF NOT EXISTS ix_inventory_cover
+                                ON inventory(user_id, ingredient_id, quantity, minimum_threshold, expiration_date);
+"""
+
 
 conversions_schema = """CREATE TABLE IF NOT EXISTS conversions (
                             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -54,6 +63,11 @@ recipes_schema = """CREATE TABLE IF NOT EXISTS recipes (
                     );
 """
 
+# Foreign key columns get their own indexes so joins on them, and the ON DELETE CASCADE from the parent
+# tables, seek instead of scanning. conversions(ingredient_id) is already covered by its UNIQUE constraint.
+recipes_indexes_schema = """CREATE INDEX IF NOT EXISTS ix_recipes_user ON recipes(user_id);
+"""
+
 
 recipe_ingredients_schema = """CREATE TABLE IF NOT EXISTS recipe_ingredients (
                                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -65,4 +79,21 @@ recipe_ingredients_schema = """CREATE TABLE IF NOT EXISTS recipe_ingredients (
                                     FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE,
                                     FOREIGN KEY (ingredient_id) REFERENCES ingredients(id) ON DELETE CASCADE
                                 );
-"""
\ No newline at end of file
+"""
+
+recipe_ingredients_indexes_schema = """CREATE INDEX IF NOT EXISTS ix_recipe_ingredients_recipe ON recipe_ingredients(recipe_id);
+                                        CREATE INDEX IF NOT EXISTS ix_recipe_ingredients_ingredient ON recipe_ingredients(ingredient_id);
+"""
+
+# All table and index definitions as a single script so they can be created with one executescript call.
+schema_ddl = "\n".join([
+    users_schema,
+    ingredients_schema,
+    inventory_schema,
+    inventory_indexes_schema,
+    conversions_schema,
+    recipes_schema,
+    recipes_indexes_schema,
+    recipe_ingredients_schema,
+    recipe_ingredients_indexes_schema,
+])
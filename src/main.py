@@ -1,22 +1,42 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Path
+from fastapi.responses import Response, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.routing import APIRoute
 from contextlib import asynccontextmanager
+from inspect import iscoroutinefunction
+import asyncio
 import os
 import logging
+from typing import Annotated
 
-from src.asqlite_class import SqliteManager
+from src.asqlite_class import SqliteManager, WAL_CHECKPOINT_INTERVAL_SECONDS
 from src.data_models import (
-    IngredientInsertion,
-    InventoryInsertion,
     Ingredient,
     IngredientFullResponse,
+    IngredientLookup,
     InventoryUpdate
 )
+from src.error_models import (
+    IngredientAlreadyExistsInInventoryError,
+    IngredientNotFoundError,
+    InventoryDeletionError,
+    InventoryUpdateError
+)
 
 # Constants
 DB_NAME = os.environ["DB_NAME"]
+# Number of uvicorn worker processes when run as `python -m src.main`
+WORKERS = int(os.getenv("WEB_CONCURRENCY", "1"))
+# Delete the database file on shutdown (local testing only). Every worker runs the lifespan, so with
+# several workers the first one to stop would delete the database under the others; leave this unset then.
+DELETE_DB_ON_SHUTDOWN = os.getenv("DELETE_DB_ON_SHUTDOWN") == "1"
+HEALTH_CHECK_BODY = b'{"status":"ok"}'
+
+# Ingredient ids are AUTOINCREMENT keys starting at 1, so anything lower is rejected with a 422 before touching the database
+IngredientId = Annotated[int, Path(ge=1)]
 asqlite_manager = None
 
 # Set up logger
@@ -24,9 +44,49 @@ logger = logging.getLogger('uvicorn.error')
 logger.setLevel(logging.INFO)
 
 
+def check_endpoints_are_async(app: FastAPI) -> None:
+    """
+    Make sure every endpoint is an `async def`. FastAPI runs plain `def` endpoints on its small threadpool,
+    which becomes the bottleneck under load.
+
+    Args:
+        app (FastAPI) - The app whose routes are checked.
+    Returns:
+        None.
+    Raises:
+        RuntimeError - If any endpoint is not a coroutine function.
+    """
+    sync_endpoints = [route.path for route in app.routes if isinstance(route, APIRoute) and not iscoroutinefunction(route.endpoint)]
+    if sync_endpoints:
+        raise RuntimeError(f"Endpoints must be declared with `async def`: {sync_endpoints}")
+
+
+async def checkpoint_periodically(manager: SqliteManager, interval: float = WAL_CHECKPOINT_INTERVAL_SECONDS) -> None:
+    """
+    Checkpoint and truncate the WAL every `interval` seconds until cancelled.
+    A failed checkpoint is logged and retried on the next tick.
+
+    Args:
+        manager (SqliteManager) - The connected manager whose database is checkpointed.
+        interval (float) - Seconds between checkpoints.
+    Returns:
+        None.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            busy, wal_frames, checkpointed = await manager.checkpoint()
+            logger.debug(f"WAL checkpoint: busy={busy}, wal_frames={wal_frames}, checkpointed={checkpointed}")
+        except Exception as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     global asqlite_manager
+    # Walks the route table once at startup; cheap enough to always run
+    check_endpoints_are_async(app)
+
     asqlite_manager = SqliteManager(db_name=DB_NAME)
     await asqlite_manager.connect()
 
@@ -34,24 +94,37 @@ async def lifespan(app: FastAPI):
     test_user_id = await asqlite_manager.create_test_user()
     logger.info(f"Created test user with id {test_user_id} for development")
 
-    yield
-    await asqlite_manager.close()
+    checkpoint_task = asyncio.create_task(checkpoint_periodically(asqlite_manager))
+    try:
+        yield
+    finally:
+        checkpoint_task.cancel()
+        try:
+            await checkpoint_task
+        except asyncio.CancelledError:
+            pass
+        # Closes the read pool and the writer even if the app is shutting down because of an error
+        await asqlite_manager.close()
     
-    # I want to delete the database file when the app is closed for testing purposes -- remove this in production
-    if os.path.exists(DB_NAME):
+    # Opt-in deletion of the database file when the app is closed, for testing purposes
+    if DELETE_DB_ON_SHUTDOWN and os.path.exists(DB_NAME):
         os.remove(DB_NAME)
         logger.info(f"Deleted database file {DB_NAME} after app shutdown")
 
 app = FastAPI(lifespan=lifespan)
+# Inventory rows repeat the same field names, so list responses compress well. Small responses are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
 
 
 async def get_current_user_id() -> int:
     return 1
 
 
-@app.get("/v1/health_check")
-async def health_check() -> dict:
-    return {"status": "ok"}
+@app.get("/v1/health_check", response_model=dict)
+async def health_check() -> Response:
+    # The body never changes, so it is serialized once; a new Response is still built per request
+    # because middleware may write to its headers.
+    return Response(content=HEALTH_CHECK_BODY, media_type="application/json")
 
 
 @app.get("/v1/inventory/by_name/{ingredient_name}/quantity")
@@ -71,7 +144,7 @@ async def get_ingredient_quantity_by_name(ingredient_name: str, user_id: int = D
 
 
 @app.get("/v1/inventory/by_id/{ingredient_id}/quantity")
-async def get_ingredient_quantity_by_id(ingredient_id: int, user_id: int = Depends(get_current_user_id)) -> float:
+async def get_ingredient_quantity_by_id(ingredient_id: IngredientId, user_id: int = Depends(get_current_user_id)) -> float:
     """
     Get the quantity of an ingredient id from the user's inventory as a float.
 
@@ -97,18 +170,18 @@ async def get_ingredient_measurement_unit_by_name(ingredient_name: str, user_id:
     Returns:
         str - The measurement unit of the ingredient.
     Raises:
-        HTTPException - If the ingredient is not found in the `ingredients` table.
+        HTTPException - 404 if the ingredient is not found in the `ingredients` table. Database errors are not caught and return 500.
     """
     try:
         measurement_unit: str = await asqlite_manager.get_ingredient_measurement_unit_by_name(ingredient_name=ingredient_name)
         return measurement_unit
-    except Exception as e:
+    except IngredientNotFoundError as e:
         error_msg = f"Got an error: {e}. {ingredient_name} not found in ingredients table. Please add it into the ingredients table."
         raise HTTPException(status_code=404, detail=error_msg)
 
 
 @app.get("/v1/ingredients/by_id/{ingredient_id}/measurement_unit")
-async def get_ingredient_measurement_unit_by_id(ingredient_id: int, user_id: int = Depends(get_current_user_id)) -> str:
+async def get_ingredient_measurement_unit_by_id(ingredient_id: IngredientId, user_id: int = Depends(get_current_user_id)) -> str:
     """
     Get the measurement unit of the ingredient name provided.
 
@@ -119,12 +192,12 @@ async def get_ingredient_measurement_unit_by_id(ingredient_id: int, user_id: int
     Returns:
         str - The measurement unit of the ingredient.
     Raises:
-        HTTPException - If the ingredient is not found in the `ingredients` table.
+        HTTPException - 404 if the ingredient is not found in the `ingredients` table. Database errors are not caught and return 500.
     """
     try:
         measurement_unit: str = await asqlite_manager.get_ingredient_measurement_unit_by_id(ingredient_id=ingredient_id)
         return measurement_unit
-    except Exception as e:
+    except IngredientNotFoundError as e:
         error_msg = f"Got an error: {e}. Ingredient ID {ingredient_id} not found in ingredients table. Please add it into the ingredients table."
         raise HTTPException(status_code=404, detail=error_msg)
 
@@ -159,7 +232,7 @@ async def get_ingredient_info_by_name(ingredient_name: str, user_id: int = Depen
 
 
 @app.get("/v1/inventory/by_id/{ingredient_id}/info")
-async def get_ingredient_info_by_id(ingredient_id: int, user_id: int = Depends(get_current_user_id)) -> Ingredient:
+async def get_ingredient_info_by_id(ingredient_id: IngredientId, user_id: int = Depends(get_current_user_id)) -> Ingredient:
     """
     Get the following information about the ingredient id of user id:
         - name
@@ -187,11 +260,30 @@ async def get_ingredient_info_by_id(ingredient_id: int, user_id: int = Depends(g
     return ingredient_info
 
 
+@app.post("/v1/inventory/lookup")
+async def lookup_ingredients_by_name(lookup: IngredientLookup, user_id: int = Depends(get_current_user_id)) -> dict[str, Ingredient]:
+    """
+    Get the information (name, category, unit_type, quantity, minimum_threshold, expiration_date)
+    of several ingredient names of user id in one request and one query.
+    Ingredients that are not in the user's inventory are left out of the result.
+
+    Args:
+        lookup (IngredientLookup) - The names of the ingredients.
+        user_id (int) - The user's id in the database.
+    Returns:
+        dict[str, Ingredient] - The Ingredient of each name found, keyed by ingredient name.
+    """
+    return await asqlite_manager.get_ingredient_info_bulk(
+        ingredient_names=lookup.names,
+        user_id=user_id
+    )
+
+
 @app.post("/v1/inventory", status_code=201, response_model=IngredientFullResponse)
 async def add_ingredient_to_inventory(ingredient: Ingredient, user_id: int = Depends(get_current_user_id)):
     """
     Add a new ingredient into the inventory table.
-    Break up the ingredient into two parts:
+    The ingredient carries both parts of the insertion:
         - IngredientInsertion: name, category, unit_type
         - InventoryInsertion: quantity, minimum_threshold, expiration_date
     If the ingredient already exists in the inventory table, return a 409 Conflict error.
@@ -208,70 +300,28 @@ async def add_ingredient_to_inventory(ingredient: Ingredient, user_id: int = Dep
     Raises:
         HTTPException - If the ingredient already exists in the inventory table.
     """
-    ingredient_insertion = IngredientInsertion(
-        name=ingredient.name,
-        category=ingredient.category,
-        unit_type=ingredient.unit_type
-    )
-
-    inventory_insertion = InventoryInsertion(
-        quantity=ingredient.quantity,
-        minimum_threshold=ingredient.minimum_threshold,
-        expiration_date=ingredient.expiration_date
-    )
-
+    # Resolves or creates the ingredient and inserts the inventory row in one transaction.
+    # The manager rejects a duplicate before opening it, so no existence checks are needed here.
     try:
-        ingredient_exists_in_inventory = await asqlite_manager.ingredient_exists_in_inventory_by_name(
-            ingredient_name=ingredient.name,
-            user_id=user_id
-        )
-        if ingredient_exists_in_inventory:
-            raise HTTPException(status_code=409, detail=f"{ingredient.name} already exists in the inventory. Update it's value instead.")
-        
-        ingredient_exists_in_ingredients_table = await asqlite_manager.ingredient_exists_in_ingredients_by_name(
-            ingredient_name=ingredient.name
+        inventory_meta_data: IngredientFullResponse = await asqlite_manager.add_ingredient_with_inventory(
+            user_id=user_id,
+            # Ingredient subclasses both IngredientInsertion and InventoryInsertion, so it is passed as-is
+            ingredient=ingredient,
+            inventory_insertion=ingredient
         )
-
-        if not ingredient_exists_in_ingredients_table:
-            # Add the ingredient into the ingredients table first
-            try:
-                ingredient_id = await asqlite_manager.add_ingredient_to_ingredients(ingredient_insertion)
-            except Exception as e:
-                error_msg = f"Error adding ingredient to ingredients table: {e}"
-                if e.__class__.__name__ == "IngredientAlreadyExistsInIngredientsError":
-                    raise HTTPException(status_code=409, detail=error_msg)
-                raise HTTPException(status_code=500, detail=error_msg)
-        
-        else:
-            # Get the ingredient id from the ingredients table
-            ingredient_id = await asqlite_manager.get_ingredient_id_by_name(ingredient_name=ingredient.name)
-            if not ingredient_id:
-                error_msg = f"Ingredient {ingredient.name} not found in ingredients table."
-                raise HTTPException(status_code=404, detail=error_msg)
-
-        # Add the ingredient into the inventory table
-        try:
-            inventory_meta_data: IngredientFullResponse = await asqlite_manager.add_ingredient_into_inventory(
-                user_id=user_id,
-                ingredient_id=ingredient_id,
-                inventory_insertion=inventory_insertion
-            )
-        except Exception as e:
-            error_msg = f"Error adding ingredient to inventory table: {e}"
-            if e.__class__.__name__ == "IngredientAlreadyExistsInInventoryError":
-                raise HTTPException(status_code=409, detail=error_msg)
-            raise HTTPException(status_code=500, detail=error_msg)
-        
-        return inventory_meta_data
-    
-    except HTTPException as e:
-        error_msg = f"Unknown error occurred while adding ingredient to inventory: {e}"
+    except IngredientAlreadyExistsInInventoryError:
+        # An existing ingredient is an expected client error, so only unexpected failures are logged
+        raise HTTPException(status_code=409, detail=f"{ingredient.name} already exists in the inventory. Update it's value instead.")
+    except Exception as e:
+        error_msg = f"Error adding ingredient to inventory table: {e}"
         logger.error(error_msg)
-        raise e
+        raise HTTPException(status_code=500, detail=error_msg)
+
+    return inventory_meta_data
 
 
 @app.delete("/v1/inventory/by_id/{ingredient_id}")
-async def delete_ingredient_from_inventory_by_id(ingredient_id: int, user_id: int = Depends(get_current_user_id)) -> None:
+async def delete_ingredient_from_inventory_by_id(ingredient_id: IngredientId, user_id: int = Depends(get_current_user_id)) -> None:
     """
     Delete an ingredient from the inventory table by its id for the user.
     
@@ -288,36 +338,18 @@ async def delete_ingredient_from_inventory_by_id(ingredient_id: int, user_id: in
         HTTPException - If the ingredient does not exist in the inventory table.
     """
     try:
-        # Check if the ingredient exists in the inventory for the user
-        ingredient_exists = await asqlite_manager.ingredient_exists_in_inventory_by_id(
+        # A single DELETE; no deleted row means the ingredient was not in the user's inventory
+        await asqlite_manager.delete_ingredient_from_inventory_by_id(
             ingredient_id=ingredient_id,
             user_id=user_id
         )
-        
-        if not ingredient_exists:
-            error_msg = f"Ingredient with id {ingredient_id} does not exist in inventory for user {user_id}."
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        
-        res = await asqlite_manager.delete_ingredient_from_inventory_by_id(
-            ingredient_id=ingredient_id,
-            user_id=user_id
-        )
-
-        if not res:
-            error_msg = f"Ingredient with id {ingredient_id} could not be deleted in inventory for user {user_id}."
-            raise HTTPException(status_code=404, detail=error_msg)
-        else:
-            logger.info(f"Deleted ingredient with id {ingredient_id} from inventory for user {user_id}.")
-    
+    except InventoryDeletionError as e:
+        error_msg = f"Error deleting ingredient from inventory: {e}"
+        raise HTTPException(status_code=404, detail=error_msg)
     except Exception as e:
-        if e.__class__.__name__ == "InventoryDeletionError":
-            error_msg = f"Error deleting ingredient from inventory: {e}"
-            raise HTTPException(status_code=404, detail=error_msg)
-        else:
-            error_msg = f"Unknown error occurred while deleting ingredient from inventory: {e}"
-            logger.error(error_msg)
-            raise HTTPException(status_code=500, detail=error_msg)
+        error_msg = f"Unknown error occurred while deleting ingredient from inventory: {e}"
+        logger.error(error_msg)
+        raise HTTPException(status_code=500, detail=error_msg)
 
 
 @app.delete("/v1/inventory/by_name/{ingredient_name}")
@@ -338,39 +370,22 @@ async def delete_ingredient_from_inventory_by_name(ingredient_name: str, user_id
         HTTPException - If the ingredient does not exist in the inventory table.
     """
     try:
-        # Check if the ingredient exists in the inventory for the user
-        ingredient_exists = await asqlite_manager.ingredient_exists_in_inventory_by_name(
-            ingredient_name=ingredient_name,
-            user_id=user_id
-        )
-
-        if not ingredient_exists:
-            error_msg = f"Ingredient {ingredient_name} does not exist in inventory for user {user_id}."
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        res = await asqlite_manager.delete_ingredient_from_inventory_by_name(
+        # A single DELETE; no deleted row means the ingredient was not in the user's inventory
+        await asqlite_manager.delete_ingredient_from_inventory_by_name(
             ingredient_name=ingredient_name,
             user_id=user_id
         )
-
-        if not res:
-            error_msg = f"Ingredient with name {ingredient_name} could not be deleted in inventory for user {user_id}."
-            raise HTTPException(status_code=404, detail=error_msg)
-        else:
-            logger.info(f"Deleted ingredient {ingredient_name} from inventory for user {user_id}.")
-    
+    except InventoryDeletionError as e:
+        error_msg = f"Error deleting ingredient from inventory: {e}"
+        raise HTTPException(status_code=404, detail=error_msg)
     except Exception as e:
-        if e.__class__.__name__ == "InventoryDeletionError":
-            error_msg = f"Error deleting ingredient from inventory: {e}"
-            raise HTTPException(status_code=404, detail=error_msg)
-        else:
-            error_msg = f"Unknown error occurred while deleting ingredient from inventory: {e}"
-            logger.error(error_msg)
-            raise HTTPException(status_code=500, detail=error_msg)
+        error_msg = f"Unknown error occurred while deleting ingredient from inventory: {e}"
+        logger.error(error_msg)
+        raise HTTPException(status_code=500, detail=error_msg)
 
 
 @app.patch("/v1/inventory/by_id/{ingredient_id}", response_model=IngredientFullResponse)
-async def update_ingredient_in_inventory_by_id(ingredient_id: int, updates: InventoryUpdate, user_id: int = Depends(get_current_user_id)):
+async def update_ingredient_in_inventory_by_id(ingredient_id: IngredientId, updates: InventoryUpdate, user_id: int = Depends(get_current_user_id)):
     """
     For a given ingredient id, together with the user id, update the ingredient in the inventory table.
 
@@ -383,38 +398,23 @@ async def update_ingredient_in_inventory_by_id(ingredient_id: int, updates: Inve
         IngredientFullResponse - The updated ingredient information.
     
     Raises:
-        HTTPException - If the ingredient does not exist in the inventory table or if the updates are invalid.
+        HTTPException - 404 if the ingredient does not exist in the inventory table, 400 if the updates are invalid.
     """
     try:
-        # Check if the ingredient exists in the inventory for the user
-        ingredient_exists = await asqlite_manager.ingredient_exists_in_inventory_by_id(
+        # A single UPDATE ... RETURNING; no returned row means the ingredient was not in the user's inventory
+        updated_ingredient: IngredientFullResponse = await asqlite_manager.update_ingredient_in_inventory_by_id(
             ingredient_id=ingredient_id,
-            user_id=user_id
+            user_id=user_id,
+            updates=updates.model_dump(exclude_unset=True)
         )
-
-        if not ingredient_exists:
-            error_msg = f"Ingredient with id {ingredient_id} does not exist in inventory for user {user_id}."
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        # Update the ingredient in the inventory table
-        try:
-            updates = updates.model_dump(exclude_unset=True)
-            updated_ingredient: IngredientFullResponse = await asqlite_manager.update_ingredient_in_inventory_by_id(
-                ingredient_id=ingredient_id,
-                user_id=user_id,
-                updates=updates
-            )
-            return updated_ingredient
-        except Exception as e:
-            error_msg = f"Error updating ingredient in inventory: {e}"
-            if e.__class__.__name__ == "InventoryUpdateError":
-                raise HTTPException(status_code=400, detail=error_msg)
-            raise HTTPException(status_code=500, detail=error_msg)
-    
-    except HTTPException as e:
-        error_msg = f"Unknown error occurred while updating ingredient in inventory: {e}"
-        logger.error(error_msg)
-        raise HTTPException(status_code=500, detail=error_msg)
+        return updated_ingredient
+    except IngredientNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"Error updating ingredient in inventory: {e}")
+    except InventoryUpdateError as e:
+        raise HTTPException(status_code=400, detail=f"Error updating ingredient in inventory: {e}")
+    except Exception as e:
+        logger.error(f"Unknown error occurred while updating ingredient in inventory: {e}")
+        raise HTTPException(status_code=500, detail=f"Error updating ingredient in inventory: {e}")
     
 
 @app.patch("/v1/inventory/by_name/{ingredient_name}", response_model=IngredientFullResponse)
@@ -431,58 +431,70 @@ async def update_ingredient_in_inventory_by_name(ingredient_name: str, updates:
         IngredientFullResponse - The updated ingredient information.
     
     Raises:
-        HTTPException - If the ingredient does not exist in the inventory table or if the updates are invalid.
+        HTTPException - 404 if the ingredient does not exist in the inventory table, 400 if the updates are invalid.
     """
     try:
-        # Check if the ingredient exists in the inventory for the user
-        ingredient_exists = await asqlite_manager.ingredient_exists_in_inventory_by_name(
+        # A single UPDATE ... RETURNING; no returned row means the ingredient was not in the user's inventory
+        updated_ingredient: IngredientFullResponse = await asqlite_manager.update_ingredient_in_inventory_by_name(
             ingredient_name=ingredient_name,
-            user_id=user_id
+            user_id=user_id,
+            updates=updates.model_dump(exclude_unset=True)
         )
-
-        if not ingredient_exists:
-            error_msg = f"Ingredient {ingredient_name} does not exist in inventory for user {user_id}."
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        # Update the ingredient in the inventory table
-        try:
-            updates = updates.model_dump(exclude_unset=True)
-            updated_ingredient: IngredientFullResponse = await asqlite_manager.update_ingredient_in_inventory_by_name(
-                ingredient_name=ingredient_name,
-                user_id=user_id,
-                updates=updates
-            )
-            return updated_ingredient
-        except Exception as e:
-            error_msg = f"Error updating ingredient in inventory: {e}"
-            if e.__class__.__name__ == "InventoryUpdateError":
-                raise HTTPException(status_code=400, detail=error_msg)
-            raise HTTPException(status_code=500, detail=error_msg)
-    
-    except HTTPException as e:
-        error_msg = f"Unknown error occurred while updating ingredient in inventory: {e}"
-        logger.error(error_msg)
-        raise HTTPException(status_code=500, detail=error_msg)
+        return updated_ingredient
+    except IngredientNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"Error updating ingredient in inventory: {e}")
+    except InventoryUpdateError as e:
+        raise HTTPException(status_code=400, detail=f"Error updating ingredient in inventory: {e}")
+    except Exception as e:
+        logger.error(f"Unknown error occurred while updating ingredient in inventory: {e}")
+        raise HTTPException(status_code=500, detail=f"Error updating ingredient in inventory: {e}")
 
 
-@app.get("/v1/inventory")
-async def get_all_ingredients_in_inventory(user_id: int = Depends(get_current_user_id)) -> list[IngredientFullResponse]:
+@app.get("/v1/inventory", response_model=list[IngredientFullResponse])
+async def get_all_ingredients_in_inventory(user_id: int = Depends(get_current_user_id)) -> StreamingResponse:
     """
-    Get all the ingredients in the inventory for a user.
+    Get all the ingredients in the inventory for a user, ordered by ingredient id.
+    The JSON array is streamed one chunk of rows at a time, so the full inventory is never held in memory.
+    Each chunk is read on a pooled connection that is released before the chunk is sent, so slow clients
+    do not hold readers. The first chunk is read before answering, so its failure is a 500; a failure on a
+    later chunk can only abort the 200 response, leaving the client a truncated (invalid) JSON body.
 
     Args:
         user_id (int) - The user's id in the database.
     
     Returns:
-        list[IngredientFullResponse] - A list of all ingredients in the user's inventory.
+        StreamingResponse - A JSON array of all ingredients (IngredientFullResponse) in the user's inventory.
     """
+    ingredients = asqlite_manager.iter_ingredients_in_inventory(user_id=user_id)
     try:
-        ingredients = await asqlite_manager.get_all_ingredients_in_inventory(user_id=user_id)
-        return ingredients
+        # Pull the first row before answering, so a failing query still gets a 500 instead of a broken 200 body.
+        first = await anext(ingredients, None)
     except Exception as e:
+        await ingredients.aclose()
         error_msg = f"Error fetching ingredients from inventory: {e}"
         raise HTTPException(status_code=500, detail=error_msg)
 
+    async def body():
+        if first is None:
+            yield b"[]"
+            return
+        try:
+            yield b"[" + first.model_dump_json().encode()
+            async for ingredient in ingredients:
+                yield b"," + ingredient.model_dump_json().encode()
+            yield b"]"
+        except Exception as e:
+            # The status line has already been sent; re-raising aborts the response without the closing "]"
+            logger.error(f"Error streaming ingredients from inventory for user {user_id}: {e}")
+            raise
+        finally:
+            await ingredients.aclose()
+
+    return StreamingResponse(body(), media_type="application/json")
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # "auto" uses uvloop and httptools when installed (uvicorn[standard], via fastapi[standard]) and falls back otherwise.
+    # Every worker is its own process with its own SqliteManager (writer, read pool and caches);
+    # writes across workers are serialized by SQLite's BEGIN IMMEDIATE and busy_timeout.
+    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, loop="auto", http="auto", workers=WORKERS)
@@ -0,0 +1,25 @@
+import os
+
+import pytest
+from fastapi import FastAPI
+
+# main.py reads DB_NAME at import; the app is never started here, so no database is opened
+os.environ.setdefault("DB_NAME", "test_async_purity.db")
+
+from src.main import app, check_endpoints_are_async
+
+
+def test_every_endpoint_is_async():
+    # The same check the lifespan runs at startup
+    check_endpoints_are_async(app)
+
+
+def test_startup_check_rejects_sync_endpoints():
+    sync_app = FastAPI()
+
+    @sync_app.get("/sync")
+    def sync_endpoint() -> dict:
+        return {}
+
+    with pytest.raises(RuntimeError, match="/sync"):
+        check_endpoints_are_async(sync_app)
@@ -0,0 +1,134 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from src.asqlite_class import SqliteManager
+from src.data_models import Ingredient, IngredientInsertion, InventoryInsertion
+from src.error_models import IngredientNotFoundError
+
+EGG = IngredientInsertion(name="egg", category="protein", unit_type="pieces")
+MILK = IngredientInsertion(name="milk", category="dairy", unit_type="millilitres")
+RICE = IngredientInsertion(name="rice", category="staple", unit_type="grams")
+
+
+def run_with_manager(tmp_path, scenario):
+    """Run `scenario(manager, user_id)` against a fresh database file in tmp_path."""
+    async def main():
+        manager = SqliteManager(db_name=str(tmp_path / "test.db"))
+        await manager.connect()
+        try:
+            user_id = await manager.create_test_user()
+            return await scenario(manager, user_id)
+        finally:
+            await manager.close()
+    return asyncio.run(main())
+
+
+def test_quantities_default_missing_ingredients_to_zero(tmp_path):
+    async def scenario(manager, user_id):
+        egg_id = await manager.add_ingredient_to_ingredients(EGG)
+        milk_id = await manager.add_ingredient_to_ingredients(MILK)
+        await manager.add_ingredient_into_inventory(user_id, egg_id, InventoryInsertion(quantity=6, minimum_threshold=2))
+
+        assert await manager.get_quantities_by_ids([egg_id, milk_id, 999], user_id) == {egg_id: 6.0, milk_id: 0.0, 999: 0.0}
+        assert await manager.get_quantities_by_names(["egg", "milk", "salt"], user_id) == {"egg": 6.0, "milk": 0.0, "salt": 0.0}
+        assert await manager.get_quantities_by_names(["egg"], user_id + 1) == {"egg": 0.0}
+
+    run_with_manager(tmp_path, scenario)
+
+
+def test_ingredient_ids_by_names_leaves_out_missing_names(tmp_path):
+    async def scenario(manager, user_id):
+        egg_id = await manager.add_ingredient_to_ingredients(EGG)
+        milk_id = await manager.add_ingredient_to_ingredients(MILK)
+        # Not cached, so the names are resolved through the json_each query
+        manager.invalidate_unit_cache()
+
+        assert await manager.get_ingredient_ids_by_names(["egg", "salt", "milk", "egg"]) == {"egg": egg_id, "milk": milk_id}
+        assert await manager.get_ingredient_ids_by_names([]) == {}
+
+    run_with_manager(tmp_path, scenario)
+
+
+def test_inventory_field(tmp_path):
+    async def scenario(manager, user_id):
+        egg_id = await manager.add_ingredient_to_ingredients(EGG)
+        await manager.add_ingredient_into_inventory(
+            user_id, egg_id, InventoryInsertion(quantity=6, minimum_threshold=2, expiration_date=date(2026, 11, 1))
+        )
+
+        assert await manager.get_inventory_field(egg_id, user_id, "quantity") == 6.0
+        assert await manager.get_inventory_field(egg_id, user_id, "expiration_date") == "2026-11-01"
+        assert await manager.get_inventory_field(egg_id + 1, user_id, "quantity") is None
+        with pytest.raises(ValueError):
+            await manager.get_inventory_field(egg_id, user_id, "user_id")
+
+    run_with_manager(tmp_path, scenario)
+
+
+def test_bulk_upsert_inserts_and_overwrites(tmp_path):
+    async def scenario(manager, user_id):
+        egg_id = await manager.add_ingredient_to_ingredients(EGG)
+        milk_id = await manager.add_ingredient_to_ingredients(MILK)
+        await manager.bulk_upsert_inventory([(user_id, egg_id, 6, 2, None)])
+        await manager.bulk_upsert_inventory([(user_id, egg_id, 12, 4, "2026-11-01"), (user_id, milk_id, 500, 100, None)])
+
+        egg = await manager.get_ingredient_info_by_id(egg_id, user_id)
+        assert (egg.quantity, egg.minimum_threshold, egg.expiration_date) == (12.0, 4.0, date(2026, 11, 1))
+        assert await manager.get_quantities_by_ids([milk_id], user_id) == {milk_id: 500.0}
+
+    run_with_manager(tmp_path, scenario)
+
+
+def test_add_ingredients_bulk_skips_existing_names(tmp_path):
+    async def scenario(manager, user_id):
+        await manager.add_ingredient_to_ingredients(EGG)
+
+        assert await manager.add_ingredients_bulk([EGG, MILK, RICE]) == 2
+        assert await manager.add_ingredients_bulk([MILK]) == 0
+        assert set(await manager.get_ingredient_ids_by_names(["egg", "milk", "rice"])) == {"egg", "milk", "rice"}
+
+    run_with_manager(tmp_path, scenario)
+
+
+def test_add_inventory_bulk_skips_existing_rows(tmp_path):
+    async def scenario(manager, user_id):
+        await manager.add_ingredients_bulk([EGG, MILK])
+        items = {"egg": InventoryInsertion(quantity=6, minimum_threshold=2), "milk": InventoryInsertion(quantity=500, minimum_threshold=100)}
+
+        assert await manager.add_inventory_bulk(user_id, {"egg": items["egg"]}) == 1
+        assert await manager.add_inventory_bulk(user_id, items) == 1
+        assert await manager.get_quantities_by_names(["egg", "milk"], user_id) == {"egg": 6.0, "milk": 500.0}
+
+    run_with_manager(tmp_path, scenario)
+
+
+def test_add_inventory_bulk_rolls_back_on_missing_ingredient(tmp_path):
+    async def scenario(manager, user_id):
+        await manager.add_ingredient_to_ingredients(EGG)
+        items = {"egg": InventoryInsertion(quantity=6, minimum_threshold=2), "salt": InventoryInsertion(quantity=1, minimum_threshold=0)}
+
+        with pytest.raises(IngredientNotFoundError, match="salt"):
+            await manager.add_inventory_bulk(user_id, items)
+        assert await manager.get_quantities_by_names(["egg"], user_id) == {"egg": 0.0}
+        # The preloaded metadata survives the rollback
+        assert await manager.get_ingredient_measurement_unit_by_name("egg") == "pieces"
+
+    run_with_manager(tmp_path, scenario)
+
+
+def test_import_ingredients_creates_missing_ingredients(tmp_path):
+    async def scenario(manager, user_id):
+        await manager.add_ingredient_to_ingredients(EGG)
+        shopping_list = [
+            Ingredient(name="egg", category="protein", unit_type="pieces", quantity=6, minimum_threshold=2),
+            Ingredient(name="rice", category="staple", unit_type="grams", quantity=1000, minimum_threshold=200),
+        ]
+
+        assert await manager.import_ingredients(user_id, shopping_list) == 2
+        assert await manager.import_ingredients(user_id, shopping_list) == 0
+        assert await manager.get_quantities_by_names(["egg", "rice"], user_id) == {"egg": 6.0, "rice": 1000.0}
+        assert await manager.get_ingredient_measurement_unit_by_name("rice") == "grams"
+
+    run_with_manager(tmp_path, scenario)